@@ -1,14 +1,13 @@
 import asyncio
-import functools
 import itertools
 import os
 import typing
 from types import TracebackType
 
-import aiohttp
 from dotenv import load_dotenv
 
 from falcon_alliance.utils import *
+from falcon_alliance.utils.functions import caching_headers
 from falcon_alliance.schemas import *
 
 __all__ = ["ApiClient"]
@@ -37,9 +36,15 @@ class ApiClient:
         >>> with ApiClient():
         ...     print(Team(4099).event("2022iri", matches=True, keys=True))
         ["2022iri_f1m1", "2022iri_f1m2", ...]
+
+        Responses can also be saved to a directory, so that later runs only download the responses that have changed:
+
+        >>> with ApiClient(cache_dir=".tba_cache") as api_client:
+        ...     print(api_client.team(4099).key)
+        frc4099
     """
 
-    def __init__(self, api_key: str = None, auth_secret: str = ""):
+    def __init__(self, api_key: str = None, auth_secret: str = "", cache_dir: typing.Optional[str] = None):
         if api_key is None:
             try:
                 api_key = os.environ["TBA_API_KEY"]
@@ -54,6 +59,13 @@ class ApiClient:
         BaseSchema.add_auth_secret(auth_secret)
         InternalData.loop.run_until_complete(InternalData.set_session())
 
+        # The disk cache is shared by every client, so the one in use before this client is restored once it's closed.
+        self._cache_dir = cache_dir
+        self._previous_disk_cache_dir = InternalData.disk_cache_dir
+
+        if cache_dir is not None:
+            InternalData.enable_disk_cache(cache_dir)
+
     def __enter__(self) -> "ApiClient":
         if InternalData.session is None:
             InternalData.loop.run_until_complete(InternalData.set_session())
@@ -67,46 +79,19 @@ class ApiClient:
     ) -> None:
         self.close()
 
-    def _caching_headers(func: typing.Callable) -> typing.Callable:
-        """Decorator for utilizing the `Etag` and `If-None-Match` caching headers for the TBA API."""
-
-        @functools.wraps(func)
-        def wrapper(
-            self, *args, use_caching: bool = False, etag: str = "", silent: bool = False, **kwargs
-        ) -> typing.Any:
-            """Wrapper for adding headers to cache the results from the TBA API."""
-
-            self.use_caching = use_caching
-            self.silent = silent
-
-            if etag:
-                self.etag = etag
-
-            try:
-                return func(self, *args, **kwargs)
-            except aiohttp.ContentTypeError:
-                if not silent:
-                    raise NotModifiedSinceError from None
-                else:
-                    return_type = str(func.__annotations__["return"]).lower()
-
-                    if "list" in return_type:
-                        return []
-                    elif "dict" in return_type:  # pragma: no cover
-                        return {}
-
-        return wrapper
-
     def close(self) -> None:
-        """Closes the ongoing session (`aiohttp.ClientSession`)."""
+        """Closes the ongoing session (`aiohttp.ClientSession`) and stops saving responses to `cache_dir` if it was passed in."""  # noqa
         InternalData.loop.run_until_complete(self._close())
 
+        if self._cache_dir is not None:
+            InternalData.disk_cache_dir = self._previous_disk_cache_dir
+
     async def _close(self) -> None:
         """Asynchronous helper function for closing the ongoing session (`aiohttp.ClientSession`)."""
         await InternalData.session.close()
         InternalData.session = None
 
-    @_caching_headers
+    @caching_headers
     async def _get_year_events(
         self, year: int, simple: bool = False, keys: bool = False
     ) -> typing.List[typing.Union[Event, str]]:
@@ -129,9 +114,9 @@ class ApiClient:
         if keys:
             return response
         else:
-            return [Event(**event_data) for event_data in response]
+            return Event.from_many(response)
 
-    @_caching_headers
+    @caching_headers
     async def _get_team_page(
         self,
         page_num: typing.Optional[int] = None,
@@ -157,28 +142,29 @@ class ApiClient:
                 url=construct_url("teams", year=year, page_num=page_num, simple=simple, keys=keys),
                 headers=self._headers,
             )
-            return [Team(**team_data) if not isinstance(team_data, str) else team_data for team_data in response]
+            return response if keys else Team.from_many(response)
         else:
-            return list(
-                itertools.chain.from_iterable(
-                    await asyncio.gather(
-                        *[
-                            self._get_team_page(
-                                spec_num,
-                                year,
-                                simple,
-                                keys,
-                                use_caching=self.use_caching,
-                                etag=self.etag,
-                                silent=self.silent,
-                            )
-                            for spec_num in range(20)
-                        ]
+            all_teams = []
+
+            for page_teams in await asyncio.gather(
+                *[
+                    self._get_team_page(
+                        spec_num,
+                        year,
+                        simple,
+                        keys,
+                        use_caching=self.use_caching,
+                        etag=self.etag,
+                        silent=self.silent,
                     )
-                )
-            )
+                    for spec_num in range(20)
+                ]
+            ):
+                all_teams.extend(page_teams)
 
-    @_caching_headers
+            return all_teams
+
+    @caching_headers
     def districts(self, year: int) -> typing.List[District]:
         """
         Retrieves all FRC districts during a year.
@@ -192,9 +178,9 @@ class ApiClient:
         response = InternalData.loop.run_until_complete(
             InternalData.get(current_instance=self, url=construct_url("districts", year=year), headers=self._headers)
         )
-        return [District(**district_data) for district_data in response]
+        return District.from_many(response)
 
-    @_caching_headers
+    @caching_headers
     def event(self, event_key: str, simple: bool = False) -> Event:
         """
         Retrieves and returns a record of teams based on the parameters given.
@@ -211,9 +197,9 @@ class ApiClient:
                 current_instance=self, url=construct_url("event", key=event_key, simple=simple), headers=self._headers
             )
         )
-        return Event(**response)
+        return Event.from_dict(response)
 
-    @_caching_headers
+    @caching_headers
     def events(
         self, year: typing.Union[range, int], simple: bool = False, keys: bool = False
     ) -> typing.List[typing.Union[Event, str]]:
@@ -232,25 +218,26 @@ class ApiClient:
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
 
         if isinstance(year, range):
-            return list(
-                itertools.chain.from_iterable(
-                    InternalData.loop.run_until_complete(
-                        asyncio.gather(
-                            *[
-                                self._get_year_events(
-                                    spec_year,
-                                    simple,
-                                    keys,
-                                    use_caching=self.use_caching,
-                                    etag=self.etag,
-                                    silent=self.silent,
-                                )
-                                for spec_year in year
-                            ]
+            all_events = []
+
+            for year_events in InternalData.loop.run_until_complete(
+                asyncio.gather(
+                    *[
+                        self._get_year_events(
+                            spec_year,
+                            simple,
+                            keys,
+                            use_caching=self.use_caching,
+                            etag=self.etag,
+                            silent=self.silent,
                         )
-                    )
+                        for spec_year in year
+                    ]
                 )
-            )
+            ):
+                all_events.extend(year_events)
+
+            return all_events
         else:
             return InternalData.loop.run_until_complete(
                 self._get_year_events(
@@ -258,7 +245,7 @@ class ApiClient:
                 )
             )
 
-    @_caching_headers
+    @caching_headers
     def match(
         self, match_key: str, simple: bool = False, timeseries: bool = False, zebra_motionworks: bool = False
     ) -> typing.Optional[typing.Union[typing.List[dict], Match, Match.ZebraMotionworks]]:
@@ -276,7 +263,7 @@ class ApiClient:
         Returns:
             typing.Optional[typing.Union[typing.List[dict], falcon_alliance.Match, falcon_alliance.Match.ZebraMotionworks]]: A Match object containing information about the match or a Match.ZebraMotionworks object representing data about where teams' robots went during the match (may not have any data for all teams or even data altogether and if so will return None) or a list of dictionaries containing timeseries data for a match.
         """  # noqa
-        if (simple, timeseries, zebra_motionworks).count(True) > 1:
+        if bool(simple) + bool(timeseries) + bool(zebra_motionworks) > 1:
             raise ValueError(
                 "Only one parameter out of `simple`, `keys`, and `statuses` can be True. "
                 "You can't mix and match parameters."
@@ -299,9 +286,9 @@ class ApiClient:
             if zebra_data:
                 return Match.ZebraMotionworks(**response)
         else:
-            return Match(**response)
+            return Match.from_dict(response)
 
-    @_caching_headers
+    @caching_headers
     def status(self) -> APIStatus:
         """
         Retrieves information about TBA's API status.
@@ -314,7 +301,7 @@ class ApiClient:
         )
         return APIStatus(**response)
 
-    @_caching_headers
+    @caching_headers
     def team(self, team_key: typing.Union[int, str], simple: bool = False) -> Team:
         """
         Retrieves and returns a record of teams based on the parameters given.
@@ -333,9 +320,9 @@ class ApiClient:
                 current_instance=self, url=construct_url("team", key=team_key, simple=simple), headers=self._headers
             )
         )
-        return Team(**response)
+        return Team.from_dict(response)
 
-    @_caching_headers
+    @caching_headers
     def teams(
         self, page_num: int = None, year: typing.Union[range, int] = None, simple: bool = False, keys: bool = False
     ) -> typing.List[typing.Union[Team, str]]:
@@ -355,7 +342,7 @@ class ApiClient:
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
 
         if isinstance(year, range):
-            all_responses = list(
+            all_responses = set(
                 itertools.chain.from_iterable(
                     InternalData.loop.run_until_complete(
                         asyncio.gather(
@@ -376,7 +363,7 @@ class ApiClient:
                 )
             )
 
-            return sorted(list(set(all_responses)))
+            return sorted(all_responses)
 
         else:
             return InternalData.loop.run_until_complete(
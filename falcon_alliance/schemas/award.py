@@ -3,11 +3,6 @@ from dataclasses import dataclass
 
 from falcon_alliance.schemas.base_schema import BaseSchema
 
-try:
-    from falcon_alliance_utils import *
-except ImportError:
-    from ..utils import *
-
 
 class Award(BaseSchema):
     """Class representing an award's information for a team or during an event.
@@ -24,16 +19,26 @@ class Award(BaseSchema):
     class AwardRecipient:
         """Class containing information about an award's recipient."""
 
+        __slots__ = ("team_key", "awardee")
+
         team_key: str
         awardee: typing.Optional[str]
 
     def __init__(self, **kwargs):
-        self.name: typing.Optional[str] = kwargs.get("name")
-        self.award_type: typing.Optional[int] = kwargs.get("award_type")
-        self.event_key: typing.Optional[str] = kwargs.get("event_key")
+        self._set_attributes(kwargs)
+        super().__init__()
+
+    def _set_attributes(self, data: dict) -> None:
+        """
+        Sets all of the attributes of an award.
+
+        Args:
+            data (dict): A dictionary containing the award's data.
+        """
+        self.name: typing.Optional[str] = data.get("name")
+        self.award_type: typing.Optional[int] = data.get("award_type")
+        self.event_key: typing.Optional[str] = data.get("event_key")
         self.recipient_list: typing.Optional[list] = [
-            self.AwardRecipient(**recipient_data) for recipient_data in kwargs.get("recipient_list", [])
+            self.AwardRecipient(**recipient_data) for recipient_data in data.get("recipient_list", [])
         ]
-        self.year: typing.Optional[int] = kwargs.get("year")
-
-        super().__init__()
+        self.year: typing.Optional[int] = data.get("year")
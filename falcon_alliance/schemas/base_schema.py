@@ -1,14 +1,57 @@
+import functools
+import time
+import typing
+
+from falcon_alliance.utils import InternalData
+
+_Schema = typing.TypeVar("_Schema", bound="BaseSchema")
+
+
 class BaseSchema:
     """Base class for all schemas."""
 
     _auth_secret = ""
     _headers = None
 
+    # Attributes holding the data of properties that are only built once they're accessed, mapped to those properties.
+    _lazy_attributes: typing.Dict[str, str] = {}
+
     def __init__(self):
-        attributes_formatted = ""
         self.etag = ""
 
-        self._as_dictionary = dict(vars(self))
+        self._attributes = dict(vars(self))
+
+    @property
+    def _as_dictionary(self) -> dict:
+        """The schema's attributes, with the properties that are only built once they're accessed in place of their data."""  # noqa
+        as_dictionary = {}
+
+        for attr_name, attr_value in self._attributes.items():
+            property_name = self._lazy_attributes.get(attr_name)
+
+            if property_name is None:
+                as_dictionary[attr_name] = attr_value
+            else:
+                as_dictionary[property_name] = getattr(self, property_name)
+
+        return as_dictionary
+
+    def __getitem__(self, item: str):
+        try:
+            return self._attributes[item]
+        except KeyError:
+            # Attributes that are built once they're accessed aren't part of the dictionary.
+            if isinstance(getattr(type(self), item, None), functools.cached_property):
+                return getattr(self, item)
+
+            raise
+
+    def __eq__(self, other: "BaseSchema"):
+        # The data the lazily built properties come from is compared instead, so they aren't built just for this.
+        return self._attributes == other._attributes
+
+    def __repr__(self):  # pragma: no cover
+        attributes_formatted = ""
 
         for attr_name, attr_value in self._as_dictionary.items():
             if attr_value is None or attr_name.startswith("_"):  # pragma: no cover
@@ -25,16 +68,90 @@ class BaseSchema:
             else:
                 attributes_formatted += f"{attr_name}={attr_value!r}, "
 
-        self._attributes_formatted = attributes_formatted[:-2]
+        return f"{type(self).__name__}({attributes_formatted[:-2]})"
 
-    def __getitem__(self, item: str):
-        return self._as_dictionary[item]
+    @classmethod
+    def from_dict(cls: typing.Type[_Schema], data: dict) -> _Schema:
+        """
+        Creates a schema from a dictionary containing its data, such as the ones returned from TBA's API.
 
-    def __eq__(self, other: "BaseSchema"):
-        return self._as_dictionary == other._as_dictionary
+        This skips repacking the dictionary into keyword arguments and the handling of positional arguments that some schemas do in `__init__`, so it is the faster way of creating schemas from a response.
 
-    def __repr__(self):  # pragma: no cover
-        return f"{type(self).__name__}({self._attributes_formatted})"
+        Args:
+            data (dict): A dictionary containing the data of the schema.
+
+        Returns:
+            BaseSchema: An object of the schema this is called on representing the data given.
+        """  # noqa
+        schema = cls.__new__(cls)
+        schema._set_attributes(data)
+
+        BaseSchema.__init__(schema)
+        return schema
+
+    @classmethod
+    def from_many(cls: typing.Type[_Schema], data: typing.Iterable[dict]) -> typing.List[_Schema]:
+        """
+        Creates schemas from dictionaries containing their data, such as the lists returned from TBA's API.
+
+        Args:
+            data (typing.Iterable[dict]): An iterable of dictionaries, each containing the data of a schema.
+
+        Returns:
+            typing.List[BaseSchema]: A list of objects of the schema this is called on representing the data given, in the same order.
+        """  # noqa
+        return list(map(cls.from_dict, data))
+
+    def _set_attributes(self, data: dict) -> None:
+        """
+        Sets all of the attributes of the schema, by default one for each item in the data as is. Subclasses override this to parse the data into other types or derive attributes from it.
+
+        Args:
+            data (dict): A dictionary containing the data of the schema.
+        """  # noqa
+        self.__dict__.update(data)
+
+    @functools.cached_property
+    def _cache(self) -> dict:
+        """Results of requests memoized on this instance with their expiry, keyed by the endpoint (and its parameters) they came from."""  # noqa
+        return {}
+
+    @property
+    def _memoizing(self) -> bool:
+        """Whether results are memoized, which they aren't while caching headers are used since each call has to reach TBA."""  # noqa
+        return not (self.etag or getattr(self, "use_caching", False))
+
+    def _memoized(self, cache_key: tuple) -> typing.Optional[typing.Any]:
+        """
+        Retrieves a result memoized on this instance.
+
+        Args:
+            cache_key (tuple): The endpoint (and its parameters) the result came from.
+
+        Returns:
+            typing.Any, optional: The result, or None if it wasn't memoized, has expired or caching headers are used.
+        """
+        if self._memoizing:
+            expiry, result = self._cache.get(cache_key, (0.0, None))
+
+            if expiry > time.monotonic():
+                return result
+
+    def _memoize(self, cache_key: tuple, result: typing.Any, url: str) -> None:
+        """
+        Memoizes a result on this instance for as long as the response from the URL it came from is cached in memory.
+
+        Args:
+            cache_key (tuple): The endpoint (and its parameters) the result came from.
+            result (typing.Any): The result to memoize.
+            url (str): The URL the result came from, whose time to live (see `InternalData.CACHE_TTLS`) the result has.
+        """
+        if self._memoizing:
+            self._cache[cache_key] = (time.monotonic() + InternalData.cache_ttl(url), result)
+
+    def invalidate_cache(self) -> None:
+        """Clears the results memoized on this instance so the next call of a memoized method sends a new request."""
+        self.__dict__.pop("_cache", None)
 
     @classmethod
     def add_headers(cls, headers: dict) -> None:
@@ -2,6 +2,8 @@ import typing
 from dataclasses import dataclass
 from enum import Enum
 
+from falcon_alliance.utils.functions import to_snake_case
+
 
 class EventTeamStatus:
     """Class representing a team's status during an event.
@@ -34,16 +36,13 @@ class EventTeamStatus:
         """Information about the team used to determine ranking for an event."""
 
         def __init__(self, sort_orders: list, sort_order_info: typing.List[dict]):
-            self._attributes_formatted = ""
-
-            for data, data_info in zip(sort_orders, sort_order_info):
-                snake_case_name = data_info["name"].lower().replace(" ", "_").replace("+", "plus")
+            self._names = [to_snake_case(data_info["name"]) for data_info in sort_order_info]
 
+            for data, snake_case_name in zip(sort_orders, self._names):
                 setattr(self, snake_case_name, data)
-                self._attributes_formatted += f"{snake_case_name}={data!r}, "
 
         def __repr__(self):  # pragma: no cover
-            return f"SortOrders({self._attributes_formatted.rstrip(', ')})"
+            return f"SortOrders({', '.join(f'{name}={getattr(self, name)!r}' for name in self._names)})"
 
     @dataclass()
     class Ranking:
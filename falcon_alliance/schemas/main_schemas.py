@@ -1,15 +1,14 @@
 import asyncio
 import datetime
 import functools
+import heapq
 import itertools
+import operator
 import statistics
 import typing
 from dataclasses import dataclass
 from json import dumps
-from re import match
-from statistics import mean
-
-import aiohttp
+from urllib.parse import urlencode
 
 from falcon_alliance.schemas.award import Award
 from falcon_alliance.schemas.base_schema import BaseSchema
@@ -20,53 +19,109 @@ from falcon_alliance.schemas.robot import Robot
 
 try:
     from falcon_alliance.utils import *
+    from falcon_alliance.utils.functions import caching_headers, to_snake_case, url_suffix
 except ImportError:  # pragma: no cover
     from ...falcon_alliance.utils import *
+    from ...falcon_alliance.utils.functions import caching_headers, to_snake_case, url_suffix
 
 __all__ = ["District", "Event", "Team"]
-PARSING_FORMAT = "%Y-%m-%d"
+NOMINATIM_HEADERS = {"User-Agent": "FalconAlliance (https://github.com/team4099/FalconAlliance)"}
+_METRIC_ATTR = {
+    Metrics.OPR: operator.attrgetter("oprs"),
+    Metrics.DPR: operator.attrgetter("dprs"),
+    Metrics.CCWM: operator.attrgetter("ccwms"),
+}
+_OPR_METRICS = frozenset(_METRIC_ATTR)
 
 
-class District(BaseSchema):
-    """Class representing a district containing methods to get specific district information.
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date: str) -> datetime.datetime:
+    """
+    Parses a date from TBA (eg "2022-03-17"), memoizing the result since many events share the same dates.
 
-    Attributes:
-        key (str): 	Key for this district, e.g. 2022chs.
-        year (int): Year this district participated.
-        abbreviation (str): The short identifier for the district.
-        display_name (str, optional): The long name for the district.
+    The dates are in the ISO 8601 format (YYYY-MM-DD), so they're parsed with `fromisoformat` rather than the slower `strptime`.
+
+    Args:
+        date (str): A string representing a date in the format of YYYY-MM-DD.
+
+    Returns:
+        datetime.datetime: A datetime object representing the date.
+    """  # noqa
+    return datetime.datetime.fromisoformat(date)
+
+
+def _team_event_validation_error(
+    awards: bool, matches: bool, simple: bool, keys: bool, status: bool
+) -> typing.Optional[str]:
+    """
+    Validates a combination of the flags passed into `Team.event`.
+
+    Returns:
+        typing.Optional[str]: The message of the error to raise for the combination, or None if it is valid.
     """
+    if not awards and not matches and not status:
+        return "Either awards, matches or status must be True for this function."
+    elif simple and keys:
+        return "simple and keys cannot both be True, you must choose one mode over the other."
+    elif awards and (simple or keys or matches):
+        return (
+            "awards cannot be True in conjunction with simple, keys or matches, "
+            "if awards is True then simple, keys, and matches must be False."
+        )
+    elif status and (simple or keys or matches):
+        return (
+            "status cannot be True in conjunction with simple, keys or matches "
+            "if statuses is True then simple, keys, and matches must be False."
+        )
+
 
-    # Copied over from api_client.py because autocomplete doesn't work
-    # when the decorator is in another file from the functions it decorates.
-    def _caching_headers(func: typing.Callable) -> typing.Callable:
-        """Decorator for utilizing the `Etag` and `If-None-Match` caching headers for the TBA API."""
+# Maps every combination of (awards, matches, simple, keys, status) to its validation error (or None), the flags
+# must be normalized with `bool` before being looked up since callers may pass in any truthy or falsy value.
+_TEAM_EVENT_VALIDATION = {
+    flags: _team_event_validation_error(*flags) for flags in itertools.product((False, True), repeat=5)
+}
 
-        @functools.wraps(func)
-        def wrapper(
-            self, *args, use_caching: bool = False, etag: str = "", silent: bool = False, **kwargs
-        ) -> typing.Any:
-            """Wrapper for adding headers to cache the results from the TBA API."""
 
-            self.use_caching = use_caching
-            self.silent = silent
+def _team_events_validation_error(
+    simple: bool, keys: bool, statuses: bool, no_year: bool, year_is_range: bool
+) -> typing.Optional[str]:
+    """
+    Validates a combination of the flags passed into `Team.events`.
 
-            self.etag = etag or self.etag
+    Returns:
+        typing.Optional[str]: The message of the error to raise for the combination, or None if it is valid.
+    """
+    if simple and keys:
+        return "simple and keys cannot both be True, you must choose one mode over the other."
+    elif statuses and (simple or keys):
+        return (
+            "statuses cannot be True in conjunction with simple or keys,"
+            " if statuses is True then simple and keys must be False."
+        )
+    elif statuses and no_year:
+        return "statuses cannot be True if a year isn't passed into Team.events."
+    elif statuses and year_is_range:
+        return "statuses cannot be True when year is a range object."
 
-            try:
-                return func(self, *args, **kwargs)
-            except aiohttp.ContentTypeError:  # pragma: no cover
-                if not silent:
-                    raise NotModifiedSinceError from None
-                else:
-                    return_type = str(func.__annotations__["return"]).lower()
 
-                    if "list" in return_type:
-                        return []
-                    elif "dict" in return_type:
-                        return {}
+# Maps every combination of (simple, keys, statuses, no year, year is a range) to its validation error (or None), the
+# flags are normalized with `bool` before being looked up like the ones for `Team.event`.
+_TEAM_EVENTS_VALIDATION = {
+    flags: _team_events_validation_error(*flags) for flags in itertools.product((False, True), repeat=5)
+}
 
-        return wrapper
+
+class District(BaseSchema):
+    """Class representing a district containing methods to get specific district information.
+
+    The district's rankings are memoized on the instance for as long as the response they came from is cached (see `InternalData.CACHE_TTLS`), unless `use_caching` or `etag` is passed in. Call `invalidate_cache` to retrieve them again sooner.
+
+    Attributes:
+        key (str): 	Key for this district, e.g. 2022chs.
+        year (int): Year this district participated.
+        abbreviation (str): The short identifier for the district.
+        display_name (str, optional): The long name for the district.
+    """  # noqa
 
     @dataclass()
     class Ranking:
@@ -80,35 +135,43 @@ class District(BaseSchema):
         event_points: typing.List[dict] = None
 
     def __init__(self, *args, **kwargs):
-        if len(args) == 2:
-            if isinstance(args[0], int) and isinstance(args[1], str):
-                self.abbreviation = args[1]
-                self.year = args[0]
-                self.key = f"{self.year}{self.abbreviation}"
-            elif isinstance(args[0], str) and isinstance(args[1], int):
-                self.abbreviation = args[0]
-                self.year = args[1]
-                self.key = f"{self.year}{self.abbreviation}"
-        elif len(args) == 1:
-            (self.key,) = args
-            self.year: typing.Optional[int] = kwargs.get("year") or int(match(r"\d+", self.key)[0])
-            self.abbreviation: typing.Optional[str] = kwargs.get("abbreviation") or self.key.replace(str(self.year), "")
+        if len(args) < 2:
+            # The key is either the only positional argument or passed in as a keyword argument.
+            self._set_attributes({**kwargs, "key": args[0]} if args else kwargs)
+        elif isinstance(args[0], int) and isinstance(args[1], str):
+            self._set_attributes({**kwargs, "key": f"{args[0]}{args[1]}", "year": args[0], "abbreviation": args[1]})
+        elif isinstance(args[0], str) and isinstance(args[1], int):
+            self._set_attributes({**kwargs, "key": f"{args[1]}{args[0]}", "year": args[1], "abbreviation": args[0]})
         else:
-            self.key: str = kwargs["key"]
-            self.year: typing.Optional[int] = kwargs.get("year") or int(match(r"\d+", self.key)[0])
-            self.abbreviation: typing.Optional[str] = kwargs.get("abbreviation") or self.key.replace(str(self.year), "")
-
-        self.display_name: typing.Optional[str] = kwargs.get("display_name")
+            raise TypeError("A district can only be created from its key, or its year (int) and abbreviation (str).")
 
         super().__init__()
 
-    @_caching_headers
-    def events(
+    def _set_attributes(self, data: dict) -> None:
+        """
+        Sets all of the attributes of a district.
+
+        Args:
+            data (dict): A dictionary containing the district's data, which must include the district's key.
+        """
+        self.key: str = data["key"]
+        self.year: typing.Optional[int] = data.get("year") or int(self.key[:4])
+        self.abbreviation: typing.Optional[str] = data.get("abbreviation") or self.key[4:]
+        self.display_name: typing.Optional[str] = data.get("display_name")
+
+    @functools.cached_property
+    def _base_url(self) -> str:
+        """The URL that all of the endpoints relating to this district are appended onto."""
+        return construct_url("district", key=self.key)
+
+    @caching_headers
+    async def events_async(
         self,
         simple: bool = False,
         keys: bool = False,
     ) -> typing.List[typing.Union[str, "Event"]]:
-        """Retrieves a list of events in the given district.
+        """
+        Coroutine version of `District.events`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
 
         Args:
             simple (bool): A boolean that specifies whether the results for each event should be 'shortened' and only contain more relevant information.
@@ -120,25 +183,41 @@ class District(BaseSchema):
         if simple and keys:
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
 
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url("district", key=self.key, endpoint="events", simple=simple, keys=keys),
-                headers=self._headers,
-            )
+        response = await InternalData.get(
+            current_instance=self,
+            url=f"{self._base_url}/events" + url_suffix(simple=simple, keys=keys),
+            headers=self._headers,
         )
         if keys:
             return response
         else:
-            return [Event(**event_data) for event_data in response]
+            return Event.from_many(response)
 
-    @_caching_headers
-    def teams(
+    def events(
+        self,
+        simple: bool = False,
+        keys: bool = False,
+        **kwargs,
+    ) -> typing.List[typing.Union[str, "Event"]]:
+        """Retrieves a list of events in the given district.
+
+        Args:
+            simple (bool): A boolean that specifies whether the results for each event should be 'shortened' and only contain more relevant information.
+            keys (bool): A boolean that specifies whether only the keys of the events in a given district should be retrieved.
+
+        Returns:
+            typing.List[typing.Union[str, falcon_alliance.Event]]: A list of strings with each string representing an event's key for all the events in the given district or a list of Event objects with each object representing an event in the given district.
+        """  # noqa
+        return InternalData.loop.run_until_complete(self.events_async(simple=simple, keys=keys, **kwargs))
+
+    @caching_headers
+    async def teams_async(
         self,
         simple: bool = False,
         keys: bool = False,
     ) -> typing.List[typing.Union[str, "Team"]]:
-        """Retrieves a list of teams in the given district.
+        """
+        Coroutine version of `District.teams`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
 
         Args:
             simple (bool): A boolean that specifies whether the results for each team should be 'shortened' and only contain more relevant information.
@@ -150,39 +229,72 @@ class District(BaseSchema):
         if simple and keys:
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
 
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url("district", key=self.key, endpoint="teams", simple=simple, keys=keys),
-                headers=self._headers,
-            )
+        response = await InternalData.get(
+            current_instance=self,
+            url=f"{self._base_url}/teams" + url_suffix(simple=simple, keys=keys),
+            headers=self._headers,
         )
         if keys:
             return response
         else:
-            return [Team(**event_data) for event_data in response]
+            return Team.from_many(response)
+
+    def teams(
+        self,
+        simple: bool = False,
+        keys: bool = False,
+        **kwargs,
+    ) -> typing.List[typing.Union[str, "Team"]]:
+        """Retrieves a list of teams in the given district.
+
+        Args:
+            simple (bool): A boolean that specifies whether the results for each team should be 'shortened' and only contain more relevant information.
+            keys (bool): A boolean that specifies whether only the keys of the teams in a given district should be retrieved.
+
+        Returns:
+            typing.List[typing.Union[str, falcon_alliance.Team]]: A list of strings with each string representing a team's key for all the teams in the given district or a list of Team objects with each object representing a team in the given district.
+        """  # noqa
+        return InternalData.loop.run_until_complete(self.teams_async(simple=simple, keys=keys, **kwargs))
 
-    @_caching_headers
-    def rankings(self) -> typing.List[Ranking]:
+    @caching_headers
+    async def rankings_async(self) -> typing.List[Ranking]:
         """
-        Retrieves a list of team district rankings for the given district.
+        Coroutine version of `District.rankings`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
 
         Returns:
             typing.List[falcon_alliance.District.Ranking]: A list of Ranking objects with each Ranking object representing a team's district ranking for the given district.
         """  # noqa
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url("district", key=self.key, endpoint="rankings"),
-                headers=self._headers,
-            )
+        rankings = self._memoized(("rankings",))
+        if rankings is not None:
+            return rankings
+
+        response = await InternalData.get(
+            current_instance=self,
+            url=f"{self._base_url}/rankings",
+            headers=self._headers,
         )
-        return [self.Ranking(**team_ranking_data) for team_ranking_data in response]
+        rankings = [self.Ranking(**team_ranking_data) for team_ranking_data in response]
+        self._memoize(("rankings",), rankings, f"{self._base_url}/rankings")
+
+        return rankings
+
+    def rankings(self, **kwargs) -> typing.List[Ranking]:
+        """
+        Retrieves a list of team district rankings for the given district.
+
+        Returns:
+            typing.List[falcon_alliance.District.Ranking]: A list of Ranking objects with each Ranking object representing a team's district ranking for the given district.
+        """  # noqa
+        return InternalData.loop.run_until_complete(self.rankings_async(**kwargs))
 
 
 class Event(BaseSchema):
     """Class representing an event containing methods to get specific event information
 
+    The event's matches (for each combination of parameters), OPRs and rankings, as well as the metrics computed from them, are memoized on the instance for as long as the responses they came from are cached (see `InternalData.CACHE_TTLS`), unless `use_caching` or `etag` is passed in. Call `invalidate_cache` to retrieve them again sooner.
+
+    Updating an event with the `update_*` methods clears the responses cached from its endpoints and the results memoized on this instance, but not the results memoized on other instances (eg another Event with the same key or a Team that attended it), call `invalidate_cache` on those to retrieve the updated data.
+
     Attributes:
         key (str): TBA event key with the format yyyy[EVENT_CODE], where yyyy is the year, and EVENT_CODE is the event code of the event.
         name (str, optional): Official name of event on record either provided by FIRST or organizers of offseason event.
@@ -216,41 +328,13 @@ class Event(BaseSchema):
         playoff_type_string (str, optional): String representation of the playoff_type, or None.
     """  # noqa
 
-    # Copied over from other classes in main_schemas.py as autocomplete fails to work
-    # when the decorator is defined in another class.
-    def _caching_headers(func: typing.Callable) -> typing.Callable:
-        """Decorator for utilizing the `Etag` and `If-None-Match` caching headers for the TBA API."""
-
-        @functools.wraps(func)
-        def wrapper(
-            self, *args, use_caching: bool = False, etag: str = "", silent: bool = False, **kwargs
-        ) -> typing.Any:
-            """Wrapper for adding headers to cache the results from the TBA API."""
-
-            self.use_caching = use_caching
-            self.silent = silent
-
-            self.etag = etag or self.etag
-
-            try:
-                return func(self, *args, **kwargs)
-            except aiohttp.ContentTypeError:  # pragma: no cover
-                if not silent:
-                    raise NotModifiedSinceError from None
-                else:
-                    return_type = str(func.__annotations__["return"]).lower()
-
-                    if "list" in return_type:
-                        return []
-                    elif "dict" in return_type:
-                        return {}
-
-        return wrapper
-
     @dataclass()
     class DistrictPoints:
         """Class representing an event's district points given for all teams."""
 
+        # Declared by hand as `dataclass(slots=True)` requires Python 3.10, so only for dataclasses without defaults.
+        __slots__ = ("points", "tiebreakers")
+
         points: typing.Dict[str, typing.Dict[str, int]]
         tiebreakers: typing.Dict[str, typing.Dict[str, int]]
 
@@ -258,6 +342,8 @@ class Event(BaseSchema):
     class Status:
         """Class representing a status of an alliance during an event."""
 
+        __slots__ = ("playoff_average", "level", "record", "current_level_record", "status")
+
         playoff_average: float
         level: str
         record: "Event.Record"
@@ -268,6 +354,8 @@ class Event(BaseSchema):
     class Record:
         """Class representing a record of wins, losses and ties for either a certain level or throughout the event."""
 
+        __slots__ = ("losses", "ties", "wins")
+
         losses: int
         ties: int
         wins: int
@@ -301,6 +389,8 @@ class Event(BaseSchema):
     class Insights:
         """Class representing the insights of an event (specific by year)"""
 
+        __slots__ = ("qual", "playoff")
+
         qual: dict
         playoff: dict
 
@@ -308,6 +398,8 @@ class Event(BaseSchema):
     class OPRs:
         """Class representing different metrics (OPR/DPR/CCWMs) for teams during an event."""
 
+        __slots__ = ("oprs", "dprs", "ccwms")
+
         oprs: dict
         dprs: dict
         ccwms: dict
@@ -329,48 +421,66 @@ class Event(BaseSchema):
 
                 metric_data = metric_data_mapping[metric.lower()]
 
-                return mean(metric_data.values())
+                return statistics.fmean(metric_data.values())
             else:
                 return {
-                    "opr": mean(self.oprs.values()),
-                    "dpr": mean(self.dprs.values()),
-                    "ccwm": mean(self.ccwms.values()),
+                    "opr": statistics.fmean(self.oprs.values()),
+                    "dpr": statistics.fmean(self.dprs.values()),
+                    "ccwm": statistics.fmean(self.ccwms.values()),
                 }
 
+        @staticmethod
+        def average_many(all_oprs: typing.Iterable["Event.OPRs"], metric: str) -> float:
+            """Gets the average of a metric for all teams across multiple events in a single pass, eg for season-wide analytics.
+
+            Args:
+                all_oprs (typing.Iterable[falcon_alliance.Event.OPRs]): The OPRs objects of each event to get the average across.
+                metric (str): A string representing which metric to get the average for (opr/dpr/ccwm).
+
+            Returns:
+                float: A decimal (float object) representing the average of the metric across all of the teams in every event given.
+            """  # noqa
+            metric_attribute = {"opr": "oprs", "dpr": "dprs", "ccwm": "ccwms"}.get(metric.lower())
+
+            if metric_attribute is None:
+                raise ValueError("metric must be either 'opr', 'dpr', or 'ccwm'")
+
+            return statistics.fmean(
+                itertools.chain.from_iterable(getattr(event_oprs, metric_attribute).values() for event_oprs in all_oprs)
+            )
+
     class ExtraStats:
         """Information about extra statistics regarding the ranking of a team during an event."""
 
-        def __init__(self, extra_stats: list, extra_stats_info: typing.List[dict]):
-            self._attributes_formatted = ""
-
-            for data, data_info in zip(extra_stats, extra_stats_info):
-                snake_case_name = data_info["name"].lower().replace(" ", "_").replace("+", "plus")
+        def __init__(self, extra_stats: list, extra_stats_names: typing.List[str]):
+            # The names are converted into snake case once per event in `Event.rankings` rather than for every team.
+            self._names = extra_stats_names
 
+            for data, snake_case_name in zip(extra_stats, extra_stats_names):
                 setattr(self, snake_case_name, data)
-                self._attributes_formatted += f"{snake_case_name}={data!r}, "
 
         def __repr__(self):  # pragma: no cover
-            return f"ExtraStats({self._attributes_formatted.rstrip(', ')})"
+            return f"ExtraStats({', '.join(f'{name}={getattr(self, name)!r}' for name in self._names)})"
 
     class SortOrders:
         """Information about the team used to determine ranking for an event."""
 
-        def __init__(self, sort_orders: list, sort_order_info: typing.List[dict]):
-            self._attributes_formatted = ""
-
-            for data, data_info in zip(sort_orders, sort_order_info):
-                snake_case_name = data_info["name"].lower().replace(" ", "_").replace("+", "plus")
+        def __init__(self, sort_orders: list, sort_orders_names: typing.List[str]):
+            # The names are converted into snake case once per event in `Event.rankings` rather than for every team.
+            self._names = sort_orders_names
 
+            for data, snake_case_name in zip(sort_orders, sort_orders_names):
                 setattr(self, snake_case_name, data)
-                self._attributes_formatted += f"{snake_case_name}={data!r}, "
 
         def __repr__(self):  # pragma: no cover
-            return f"SortOrders({self._attributes_formatted.rstrip(', ')})"
+            return f"SortOrders({', '.join(f'{name}={getattr(self, name)!r}' for name in self._names)})"
 
     @dataclass()
     class Ranking:
         """Class representing a team's ranking during an event."""
 
+        __slots__ = ("dq", "extra_stats", "matches_played", "qual_average", "rank", "record", "sort_orders", "team_key")
+
         dq: int
         extra_stats: "Event.ExtraStats"
         matches_played: int
@@ -391,106 +501,146 @@ class Event(BaseSchema):
 
         def __post_init__(self):
             if self.date:
-                self.date: datetime.datetime = datetime.datetime.strptime(self.date, PARSING_FORMAT)
+                self.date: datetime.datetime = _parse_date(self.date)
+
+    _lazy_attributes = {
+        "_district_data": "district",
+        "_start_date": "start_date",
+        "_end_date": "end_date",
+        "_webcasts_data": "webcasts",
+    }
 
     def __init__(self, *args, **kwargs):
-        if len(args) == 2:
-            self.year = int(args[0])
-            self.event_code = args[1]
-            self.key = f"{args[0]}{args[1]}"
-        elif len(args) == 1:
-            (self.key,) = args
-            self.year: int = kwargs.get("year") or int(match(r"\d+", self.key)[0])
-            self.event_code: str = kwargs.get("event_code") or self.key.replace(str(self.year), "")
+        if len(args) < 2:
+            # The key is either the only positional argument or passed in as a keyword argument.
+            self._set_attributes({**kwargs, "key": args[0]} if args else kwargs)
         else:
-            self.key: str = kwargs["key"]
-            self.year: int = kwargs.get("year") or int(match(r"\d+", self.key)[0])
-            self.event_code: str = kwargs.get("event_code") or self.key.replace(str(self.year), "")
+            self._set_attributes({**kwargs, "key": f"{args[0]}{args[1]}", "year": int(args[0]), "event_code": args[1]})
 
-        self.name: typing.Optional[str] = kwargs.get("name")
-        self.event_type: typing.Optional[int] = kwargs.get("event_type")
+        super().__init__()
 
-        district_data = kwargs.get("district")
-        self.district: typing.Optional[dict] = District(**district_data) if district_data else None
+    def _set_attributes(self, data: dict) -> None:
+        """
+        Sets all of the attributes of an event.
 
-        self.city: typing.Optional[str] = kwargs.get("city")
-        self.state_prov: typing.Optional[str] = kwargs.get("state_prov")
-        self.country: typing.Optional[str] = kwargs.get("country")
+        Args:
+            data (dict): A dictionary containing the event's data, which must include the event's key.
+        """
+        self.key: str = data["key"]
+        self.year: int = data.get("year") or int(self.key[:4])
+        self.event_code: str = data.get("event_code") or self.key[4:]
 
-        try:
-            self.start_date: typing.Optional[datetime.datetime] = datetime.datetime.strptime(
-                kwargs["start_date"], PARSING_FORMAT
-            )
-            self.end_date: typing.Optional[datetime.datetime] = datetime.datetime.strptime(
-                kwargs["end_date"], PARSING_FORMAT
-            )
-        except KeyError:
-            self.start_date = None
-            self.end_date = None
-
-        self.short_name: typing.Optional[str] = kwargs.get("short_name")
-        self.event_type_string: typing.Optional[str] = kwargs.get("event_type_string")
-        self.week: typing.Optional[int] = kwargs.get("week")
-
-        self.address: typing.Optional[str] = kwargs.get("address")
-        self.postal_code: typing.Optional[str] = kwargs.get("postal_code")
-        self.gmaps_place_id: typing.Optional[str] = kwargs.get("gmaps_place_id")
-        self.gmaps_url: typing.Optional[str] = kwargs.get("gmaps_url")
-        self.lat: typing.Optional[float] = kwargs.get("lat")
-        self.lng: typing.Optional[float] = kwargs.get("lng")
-        self.location_name: typing.Optional[str] = kwargs.get("location_name")
-        self.timezone: typing.Optional[str] = kwargs.get("timezone")
-
-        self.website: typing.Optional[str] = kwargs.get("website")
-
-        self.first_event_id: typing.Optional[str] = kwargs.get("first_event_id")
-        self.first_event_code: typing.Optional[str] = kwargs.get("first_event_code")
-
-        self.webcasts: typing.Optional[list] = [
-            self.Webcast(**webcast_data) for webcast_data in kwargs.get("webcasts", []) if webcast_data
-        ]
+        self.name: typing.Optional[str] = data.get("name")
+        self.event_type: typing.Optional[int] = data.get("event_type")
 
-        self.division_keys: typing.Optional[list] = kwargs.get("division_keys")
-        self.parent_event_key: typing.Optional[str] = kwargs.get("parent_event_key")
+        # The district, dates and webcasts are only built once they're accessed (see the properties below).
+        self._district_data: typing.Optional[dict] = data.get("district")
 
-        self.playoff_type: typing.Optional[int] = kwargs.get("playoff_type")
-        self.playoff_type_string: typing.Optional[str] = kwargs.get("playoff_type_string")
+        self.city: typing.Optional[str] = data.get("city")
+        self.state_prov: typing.Optional[str] = data.get("state_prov")
+        self.country: typing.Optional[str] = data.get("country")
 
-        super().__init__()
+        self._start_date: typing.Optional[str] = data.get("start_date")
+        self._end_date: typing.Optional[str] = data.get("end_date")
 
-    @_caching_headers
-    def alliances(self) -> typing.List[Alliance]:
-        """Retrieves all alliances of an event.
+        self.short_name: typing.Optional[str] = data.get("short_name")
+        self.event_type_string: typing.Optional[str] = data.get("event_type_string")
+        self.week: typing.Optional[int] = data.get("week")
+
+        self.address: typing.Optional[str] = data.get("address")
+        self.postal_code: typing.Optional[str] = data.get("postal_code")
+        self.gmaps_place_id: typing.Optional[str] = data.get("gmaps_place_id")
+        self.gmaps_url: typing.Optional[str] = data.get("gmaps_url")
+        self.lat: typing.Optional[float] = data.get("lat")
+        self.lng: typing.Optional[float] = data.get("lng")
+        self.location_name: typing.Optional[str] = data.get("location_name")
+        self.timezone: typing.Optional[str] = data.get("timezone")
+
+        self.website: typing.Optional[str] = data.get("website")
+
+        self.first_event_id: typing.Optional[str] = data.get("first_event_id")
+        self.first_event_code: typing.Optional[str] = data.get("first_event_code")
+
+        self._webcasts_data: typing.List[dict] = data.get("webcasts", [])
+
+        self.division_keys: typing.Optional[list] = data.get("division_keys")
+        self.parent_event_key: typing.Optional[str] = data.get("parent_event_key")
+
+        self.playoff_type: typing.Optional[int] = data.get("playoff_type")
+        self.playoff_type_string: typing.Optional[str] = data.get("playoff_type_string")
+
+    @functools.cached_property
+    def district(self) -> typing.Optional[District]:
+        """The district the event occurred in, if any."""
+        return District.from_dict(self._district_data) if self._district_data else None
+
+    @functools.cached_property
+    def start_date(self) -> typing.Optional[datetime.datetime]:
+        """The date the event started on, if known."""
+        return _parse_date(self._start_date) if self._start_date else None
+
+    @functools.cached_property
+    def end_date(self) -> typing.Optional[datetime.datetime]:
+        """The date the event ended on, if known."""
+        return _parse_date(self._end_date) if self._end_date else None
+
+    @functools.cached_property
+    def webcasts(self) -> typing.List[Webcast]:
+        """All the webcasts recording the event."""
+        return [self.Webcast(**webcast_data) for webcast_data in self._webcasts_data if webcast_data]
+
+    @functools.cached_property
+    def _base_url(self) -> str:
+        """The URL that all of the endpoints relating to this event are appended onto."""
+        return construct_url("event", key=self.key)
+
+    @caching_headers
+    async def alliances_async(self) -> typing.List[Alliance]:
+        """
+        Coroutine version of `Event.alliances`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
 
         Returns:
             typing.List[falcon_alliance.Event.Alliance]: A list of Alliance objects representing each alliance in the event.
         """  # noqa
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url("event", key=self.key, endpoint="alliances"),
-                headers=self._headers,
-            )
+        response = await InternalData.get(
+            current_instance=self,
+            url=f"{self._base_url}/alliances",
+            headers=self._headers,
         )
         return [self.Alliance(**alliance_info) for alliance_info in response]
 
-    @_caching_headers
-    def awards(self) -> typing.List[Award]:
+    def alliances(self, **kwargs) -> typing.List[Alliance]:
+        """Retrieves all alliances of an event.
+
+        Returns:
+            typing.List[falcon_alliance.Event.Alliance]: A list of Alliance objects representing each alliance in the event.
+        """  # noqa
+        return InternalData.loop.run_until_complete(self.alliances_async(**kwargs))
+
+    @caching_headers
+    async def awards_async(self) -> typing.List[Award]:
+        """
+        Coroutine version of `Event.awards`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
+
+        Returns:
+            typing.List[falcon_alliance.Award]: A list of Award objects representing each award distributed in an event.
+        """  # noqa
+        response = await InternalData.get(
+            current_instance=self,
+            url=f"{self._base_url}/awards",
+            headers=self._headers,
+        )
+        return Award.from_many(response)
+
+    def awards(self, **kwargs) -> typing.List[Award]:
         """Retrieves all awards distributed in an event.
 
         Returns:
             typing.List[falcon_alliance.Award]: A list of Award objects representing each award distributed in an event.
         """
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url("event", key=self.key, endpoint="awards"),
-                headers=self._headers,
-            )
-        )
-        return [Award(**award_info) for award_info in response]
+        return InternalData.loop.run_until_complete(self.awards_async(**kwargs))
 
-    @_caching_headers
+    @caching_headers
     def district_points(self) -> typing.Optional[DistrictPoints]:
         """Retrieves district points for teams during an event for both qualification and tiebreaker matches.
 
@@ -500,7 +650,7 @@ class Event(BaseSchema):
         response = InternalData.loop.run_until_complete(
             InternalData.get(
                 current_instance=self,
-                url=construct_url("event", key=self.key, endpoint="district_points"),
+                url=f"{self._base_url}/district_points",
                 headers=self._headers,
             )
         )
@@ -508,7 +658,7 @@ class Event(BaseSchema):
         if response:
             return self.DistrictPoints(**response)
 
-    @_caching_headers
+    @caching_headers
     def insights(self) -> typing.Optional[Insights]:
         """Retrieves insights of an event (specific data about performance and the like at the event; specific by game).
         Insights can only be retrieved for any events from 2016 and onwards.
@@ -519,7 +669,7 @@ class Event(BaseSchema):
         response = InternalData.loop.run_until_complete(
             InternalData.get(
                 current_instance=self,
-                url=construct_url("event", key=self.key, endpoint="insights"),
+                url=f"{self._base_url}/insights",
                 headers=self._headers,
             )
         )
@@ -527,13 +677,12 @@ class Event(BaseSchema):
         if response:
             return self.Insights(**response)
 
-    @_caching_headers
-    def matches(
+    @caching_headers
+    async def matches_async(
         self, simple: bool = False, keys: bool = False, timeseries: bool = False
     ) -> typing.List[typing.Union[str, Match]]:
-        """Retrieves all matches that occurred during an event.
-
-        Per TBA, the timeseries data is in development and therefore you should NOT rely on it.
+        """
+        Coroutine version of `Event.matches`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
 
         Args:
             simple (bool): A boolean that specifies whether the results for each match should be 'shortened' and only contain more relevant information.
@@ -543,46 +692,80 @@ class Event(BaseSchema):
         Returns:
             typing.List[typing.Union[str, falcon_alliance.Match]]: A dictionary with team keys as the keys of the dictionary and an EventTeamStatus object representing the status of said team as the values of the dictionary or a list of strings representing the keys of the teams that participated in an event or a list of Team objects, each representing a team that participated in an event.
         """  # noqa
-        if (simple, keys, timeseries).count(True) > 1:
+        if bool(simple) + bool(keys) + bool(timeseries) > 1:
             raise ValueError(
                 "Only one parameter out of `simple`, `keys`, and `timeseries`"
                 " can be True. You can't mix and match parameters."
             )
 
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url(
-                    "event", key=self.key, endpoint="matches", simple=simple, keys=keys, timeseries=timeseries
-                ),
-                headers=self._headers,
-            )
-        )
+        cache_key = ("matches", simple, keys, timeseries)
+        matches = self._memoized(cache_key)
+        if matches is not None:
+            return matches
+
+        url = f"{self._base_url}/matches" + url_suffix(simple=simple, keys=keys, timeseries=timeseries)
+        response = await InternalData.get(current_instance=self, url=url, headers=self._headers)
         if keys or timeseries:
-            return response
+            matches = response
         else:
-            return [Match(**match_data) for match_data in response]
+            matches = Match.from_many(response)
 
-    @_caching_headers
-    def oprs(self) -> OPRs:
-        """Retrieves different metrics for all teams during an event.
-        To see an explanation on OPR and other metrics retrieved from an event, see https://www.thebluealliance.com/opr.
+        self._memoize(cache_key, matches, url)
+
+        return matches
+
+    def matches(
+        self, simple: bool = False, keys: bool = False, timeseries: bool = False, **kwargs
+    ) -> typing.List[typing.Union[str, Match]]:
+        """Retrieves all matches that occurred during an event.
+
+        Per TBA, the timeseries data is in development and therefore you should NOT rely on it.
+
+        Args:
+            simple (bool): A boolean that specifies whether the results for each match should be 'shortened' and only contain more relevant information.
+            keys (bool): A boolean that specifies whether only the keys of the matches should be retrieved.
+            timeseries (bool): A boolean that specifies whether only the keys of the matches that have timeseries data should be retrieved.
 
         Returns:
-            falcon_alliance.Event.OPRs: An OPRs object containing a key/value pair for the OPRs, DPRs, and CCWMs of all teams at an event. The fields of `OPRs` may be empty if OPRs, DPRs, and CCWMs weren't calculated.
+            typing.List[typing.Union[str, falcon_alliance.Match]]: A dictionary with team keys as the keys of the dictionary and an EventTeamStatus object representing the status of said team as the values of the dictionary or a list of strings representing the keys of the teams that participated in an event or a list of Team objects, each representing a team that participated in an event.
         """  # noqa
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self, url=construct_url("event", key=self.key, endpoint="oprs"), headers=self._headers
-            )
+        return InternalData.loop.run_until_complete(
+            self.matches_async(simple=simple, keys=keys, timeseries=timeseries, **kwargs)
         )
 
+    @caching_headers
+    async def oprs_async(self) -> OPRs:
+        """
+        Coroutine version of `Event.oprs`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
+
+        Returns:
+            falcon_alliance.Event.OPRs: An OPRs object containing a key/value pair for the OPRs, DPRs, and CCWMs of all teams at an event.
+        """  # noqa
+        oprs = self._memoized(("oprs",))
+        if oprs is not None:
+            return oprs
+
+        response = await InternalData.get(current_instance=self, url=f"{self._base_url}/oprs", headers=self._headers)
+
         if response:
-            return self.OPRs(**response)
+            oprs = self.OPRs(**response)
         else:  # pragma: no cover
-            return self.OPRs(oprs={}, dprs={}, ccwms={})
+            oprs = self.OPRs(oprs={}, dprs={}, ccwms={})
+
+        self._memoize(("oprs",), oprs, f"{self._base_url}/oprs")
+
+        return oprs
+
+    def oprs(self, **kwargs) -> OPRs:
+        """Retrieves different metrics for all teams during an event.
+        To see an explanation on OPR and other metrics retrieved from an event, see https://www.thebluealliance.com/opr.
 
-    @_caching_headers
+        Returns:
+            falcon_alliance.Event.OPRs: An OPRs object containing a key/value pair for the OPRs, DPRs, and CCWMs of all teams at an event. The fields of `OPRs` may be empty if OPRs, DPRs, and CCWMs weren't calculated.
+        """  # noqa
+        return InternalData.loop.run_until_complete(self.oprs_async(**kwargs))
+
+    @caching_headers
     def predictions(self) -> dict:
         """Retrieves predictions for matches of an event. May not work for all events since this endpoint is in beta per TBA.
 
@@ -592,42 +775,64 @@ class Event(BaseSchema):
         response = InternalData.loop.run_until_complete(
             InternalData.get(
                 current_instance=self,
-                url=construct_url("event", key=self.key, endpoint="predictions"),
+                url=f"{self._base_url}/predictions",
                 headers=self._headers,
             )
         )
         return response
 
-    @_caching_headers
-    def rankings(self) -> typing.Dict[str, Ranking]:
-        """Retrieves a list of team rankings for an event.
+    @caching_headers
+    async def rankings_async(self) -> typing.Dict[str, Ranking]:
+        """
+        Coroutine version of `Event.rankings`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
 
         Returns:
             typing.Dict[str, falcon_alliance.Event.Ranking]: A dictionary with team keys as the keys of the dictionary and Ranking objects for that team's information about their ranking at an event as values of the dictionary.
         """  # noqa
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url("event", key=self.key, endpoint="rankings"),
-                headers=self._headers,
-            )
+        rankings = self._memoized(("rankings",))
+        if rankings is not None:
+            return rankings
+
+        response = await InternalData.get(
+            current_instance=self,
+            url=f"{self._base_url}/rankings",
+            headers=self._headers,
         )
-        rankings_dict = {}
+        extra_stats_names = [to_snake_case(data_info["name"]) for data_info in response["extra_stats_info"]]
+        sort_orders_names = [to_snake_case(data_info["name"]) for data_info in response["sort_order_info"]]
+
+        ranking, extra_stats, sort_orders = self.Ranking, self.ExtraStats, self.SortOrders
+        rankings = {
+            rank_info["team_key"]: ranking(
+                dq=rank_info["dq"],
+                extra_stats=extra_stats(rank_info["extra_stats"], extra_stats_names),
+                matches_played=rank_info["matches_played"],
+                qual_average=rank_info["qual_average"],
+                rank=rank_info["rank"],
+                record=rank_info["record"],
+                sort_orders=sort_orders(rank_info["sort_orders"], sort_orders_names),
+                team_key=rank_info["team_key"],
+            )
+            for rank_info in response["rankings"]
+        }
+        self._memoize(("rankings",), rankings, f"{self._base_url}/rankings")
 
-        for rank_info in response["rankings"]:
-            rank_info["extra_stats"] = self.ExtraStats(rank_info["extra_stats"], response["extra_stats_info"])
-            rank_info["sort_orders"] = self.SortOrders(rank_info["sort_orders"], response["sort_order_info"])
+        return rankings
 
-            rankings_dict[rank_info["team_key"]] = self.Ranking(**rank_info)
+    def rankings(self, **kwargs) -> typing.Dict[str, Ranking]:
+        """Retrieves a list of team rankings for an event.
 
-        return rankings_dict
+        Returns:
+            typing.Dict[str, falcon_alliance.Event.Ranking]: A dictionary with team keys as the keys of the dictionary and Ranking objects for that team's information about their ranking at an event as values of the dictionary.
+        """  # noqa
+        return InternalData.loop.run_until_complete(self.rankings_async(**kwargs))
 
-    @_caching_headers
-    def teams(
+    @caching_headers
+    async def teams_async(
         self, simple: bool = False, keys: bool = False, statuses: bool = False
     ) -> typing.Union[typing.List[typing.Union[str, "Team"]], typing.Dict[str, EventTeamStatus]]:
         """
-        Retrieves all teams who participated at an event.
+        Coroutine version of `Event.teams`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
 
         Args:
             simple (bool): A boolean that specifies whether the results for each team should be 'shortened' and only contain more relevant information.
@@ -637,18 +842,16 @@ class Event(BaseSchema):
         Returns:
             typing.Union[typing.List[typing.Union[str, falcon_alliance.Team]], typing.Dict[str, falcon_alliance.EventTeamStatus]]: A dictionary with team keys as the keys of the dictionary and an EventTeamStatus object representing the status of said team as the values of the dictionary or a list of strings representing the keys of the teams that participated in an event or a list of Team objects, each representing a team that participated in an event.
         """  # noqa
-        if (simple, keys, statuses).count(True) > 1:
+        if bool(simple) + bool(keys) + bool(statuses) > 1:
             raise ValueError(
                 "Only one parameter out of `simple`, `keys`, and `statuses` can be True."
                 " You can't mix and match parameters."
             )
 
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url("event", key=self.key, endpoint="teams", simple=simple, keys=keys, statuses=statuses),
-                headers=self._headers,
-            )
+        response = await InternalData.get(
+            current_instance=self,
+            url=f"{self._base_url}/teams" + url_suffix(simple=simple, keys=keys, statuses=statuses),
+            headers=self._headers,
         )
         if keys:
             return response
@@ -659,7 +862,71 @@ class Event(BaseSchema):
                 if team_status_info
             }
         else:
-            return [Team(**team_data) for team_data in response]
+            return Team.from_many(response)
+
+    def teams(
+        self, simple: bool = False, keys: bool = False, statuses: bool = False, **kwargs
+    ) -> typing.Union[typing.List[typing.Union[str, "Team"]], typing.Dict[str, EventTeamStatus]]:
+        """
+        Retrieves all teams who participated at an event.
+
+        Args:
+            simple (bool): A boolean that specifies whether the results for each team should be 'shortened' and only contain more relevant information.
+            keys (bool): A boolean that specifies whether only the names of the FRC teams should be retrieved.
+            statuses (bool): A boolean that specifies whether a key/value pair of the statuses of teams in an event should be returned.
+
+        Returns:
+            typing.Union[typing.List[typing.Union[str, falcon_alliance.Team]], typing.Dict[str, falcon_alliance.EventTeamStatus]]: A dictionary with team keys as the keys of the dictionary and an EventTeamStatus object representing the status of said team as the values of the dictionary or a list of strings representing the keys of the teams that participated in an event or a list of Team objects, each representing a team that participated in an event.
+        """  # noqa
+        return InternalData.loop.run_until_complete(
+            self.teams_async(simple=simple, keys=keys, statuses=statuses, **kwargs)
+        )
+
+    def _summary_stats(self, metric: Metrics) -> tuple:
+        """
+        Computes the minimum, maximum and average of a metric in a single pass, memoizing the result on this instance.
+
+        Args:
+            metric (Metrics): An Enum object representing which metric to summarize.
+
+        Returns:
+            tuple: A tuple of the item with the minimum value, the item with the maximum value and the average value, where each item is a match for Metrics.MATCH_SCORE or a tuple of the value and the team key for Metrics.OPR, Metrics.DPR and Metrics.CCWM.
+        """  # noqa
+        summary_stats = self._memoized(("summary_stats", metric))
+        if summary_stats is not None:
+            return summary_stats
+
+        if metric == Metrics.MATCH_SCORE:
+            url = f"{self._base_url}/matches"
+            items = ((match.alliances["red"].score + match.alliances["blue"].score, match) for match in self.matches())
+        else:
+            url = f"{self._base_url}/oprs"
+            items = ((value, team_key) for team_key, value in _METRIC_ATTR[metric](self.oprs()).items())
+
+        min_value = max_value = min_item = max_item = None
+        total = count = 0
+
+        for value, item in items:
+            if min_item is None or value < min_value:
+                min_value, min_item = value, item
+            if max_item is None or value > max_value:
+                max_value, max_item = value, item
+
+            total += value
+            count += 1
+
+        if not count:
+            raise ValueError(f"There is no {metric._name_} data to summarize for {self.key}.")
+
+        if metric == Metrics.MATCH_SCORE:
+            # The combined score of each match is the sum of two alliance scores, and the average is per alliance.
+            summary_stats = (min_item, max_item, total / (2 * count))
+        else:
+            summary_stats = ((min_value, min_item), (max_value, max_item), total / count)
+
+        # Expires along with the matches or OPRs it was computed from.
+        self._memoize(("summary_stats", metric), summary_stats, url)
+        return summary_stats
 
     def min(self, metric: Metrics) -> typing.Union[Match, typing.Tuple[float, "Team"]]:
         """
@@ -672,10 +939,9 @@ class Event(BaseSchema):
             typing.Union[Match, tuple[float, falcon_alliance.Team]]: A Match object representing the match with the minimum cumulative score (red alliance's score + blue alliance's score) if Metrics.MATCH_SCORE is passed into `metric` or a tuple containing the float representing the minimum OPR/DPR/CCWM during an event and a Team object representing the team that had the minimum OPR.
         """  # noqa
         if metric == Metrics.MATCH_SCORE:
-            event_matches = self.matches()
-            return min(event_matches, key=lambda match: match.alliances["red"].score + match.alliances["blue"].score)
-        elif metric in {Metrics.OPR, Metrics.DPR, Metrics.CCWM}:
-            team_key, opr = min(getattr(self.oprs(), f"{metric._name_.lower()}s").items(), key=lambda tup: tup[1])
+            return self._summary_stats(metric)[0]
+        elif metric in _OPR_METRICS:
+            opr, team_key = self._summary_stats(metric)[0]
             return opr, Team(team_key)
 
     def max(self, metric: Metrics) -> typing.Union[Match, typing.Tuple[float, "Team"]]:
@@ -689,10 +955,9 @@ class Event(BaseSchema):
             typing.Union[Match, tuple[float, falcon_alliance.Team]]: A Match object representing the match with the maximum cumulative score (red alliance's score + blue alliance's score) if Metrics.MATCH_SCORE is passed into `metric` or a tuple containing the float representing the maximum OPR/DPR/CCWM during an event and a Team object representing the team that had the maximum OPR.
         """  # noqa
         if metric == Metrics.MATCH_SCORE:
-            event_matches = self.matches()
-            return max(event_matches, key=lambda match: match.alliances["red"].score + match.alliances["blue"].score)
-        elif metric in {Metrics.OPR, Metrics.DPR, Metrics.CCWM}:
-            team_key, opr = max(getattr(self.oprs(), f"{metric._name_.lower()}s").items(), key=lambda tup: tup[1])
+            return self._summary_stats(metric)[1]
+        elif metric in _OPR_METRICS:
+            opr, team_key = self._summary_stats(metric)[1]
             return opr, Team(team_key)
 
     def average(self, metric: Metrics) -> float:
@@ -705,11 +970,32 @@ class Event(BaseSchema):
         Returns:
             float: A float representing the average match score if Metrics.MATCH_SCORE is passed into `metric` or a float representing the average OPR/DPR/CCWM.
         """  # noqa
-        if metric == Metrics.MATCH_SCORE:
-            event_scores = [alliance.score for match in self.matches() for alliance in match.alliances.values()]
-            return statistics.mean(event_scores)
-        elif metric in {Metrics.OPR, Metrics.DPR, Metrics.CCWM}:
-            return statistics.mean(getattr(self.oprs(), f"{metric._name_.lower()}s").values())
+        if metric == Metrics.MATCH_SCORE or metric in _OPR_METRICS:
+            return self._summary_stats(metric)[2]
+
+    @functools.cached_property
+    def _trusted_base_url(self) -> str:
+        """The URL that all of the endpoints of TBA's trusted (write) API relating to this event are appended onto."""
+        return f"https://www.thebluealliance.com/api/trusted/v1/event/{self.key}"
+
+    def _post_update(self, path: str, data: typing.Any) -> None:
+        """
+        Sends a POST request to one of the endpoints of TBA's trusted API relating to this event.
+
+        Afterwards the responses cached from the event's and its matches' endpoints are cleared, as are the results memoized on this instance (only this one, other instances keep theirs).
+
+        Parameters:
+            path (str): The path of the endpoint relative to the event, such as 'info/update'.
+            data (typing.Any): The data to serialize into JSON and send with the POST request.
+        """  # noqa
+        InternalData.loop.run_until_complete(
+            InternalData.post(self, url=f"{self._trusted_base_url}/{path}", data=dumps(data, separators=(",", ":")))
+        )
+
+        # The event's data was just changed, so responses cached before the update are stale.
+        self.invalidate_cache()
+        InternalData.clear_cache(f"/event/{self.key}")
+        InternalData.clear_cache(f"/match/{self.key}_")
 
     def update_info(self, data: dict) -> None:
         """
@@ -718,13 +1004,7 @@ class Event(BaseSchema):
         Parameters:
             data (dict): Dictionary containing info that the event needs to be updated with (eg FIRST code, playoff type, and webcast URLs).
         """  # noqa
-        InternalData.loop.run_until_complete(
-            InternalData.post(
-                self,
-                url=f"https://www.thebluealliance.com/api/trusted/v1/event/{self.key}/info/update",
-                data=dumps(data),
-            )
-        )
+        self._post_update("info/update", data)
 
     def update_alliance_selections(self, data: typing.List[list]) -> None:
         """
@@ -733,13 +1013,7 @@ class Event(BaseSchema):
         Parameters:
             data (list[list]): 2D list with each list representing an alliance and the elements inside each sublist representing keys in the corresponding alliance.
         """  # noqa
-        InternalData.loop.run_until_complete(
-            InternalData.post(
-                self,
-                url=f"https://www.thebluealliance.com/api/trusted/v1/event/{self.key}/alliance_selections/update",
-                data=dumps(data),
-            )
-        )
+        self._post_update("alliance_selections/update", data)
 
     def update_awards(self, data: typing.List[dict]) -> None:
         """
@@ -748,13 +1022,7 @@ class Event(BaseSchema):
         Parameters:
             data (list[dict]): List of dictionaries containing information about each award (eg name of the award, recipient of the award, and the awardee).
         """  # noqa
-        InternalData.loop.run_until_complete(
-            InternalData.post(
-                self,
-                url=f"https://www.thebluealliance.com/api/trusted/v1/event/{self.key}/awards/update",
-                data=dumps(data),
-            )
-        )
+        self._post_update("awards/update", data)
 
     def update_matches(self, data: typing.List[dict]) -> None:
         """
@@ -763,13 +1031,7 @@ class Event(BaseSchema):
         Parameters:
             data (list[dict]): List of dictionaries containing information about each match.
         """
-        InternalData.loop.run_until_complete(
-            InternalData.post(
-                self,
-                url=f"https://www.thebluealliance.com/api/trusted/v1/event/{self.key}/matches/update",
-                data=dumps(data),
-            )
-        )
+        self._post_update("matches/update", data)
 
     def delete_matches(self, data: typing.List[str]) -> None:
         """
@@ -778,13 +1040,7 @@ class Event(BaseSchema):
         Parameters:
             data (list[str]): List of matches to delete (eg ["qm1", "qm2", ...])
         """
-        InternalData.loop.run_until_complete(
-            InternalData.post(
-                self,
-                url=f"https://www.thebluealliance.com/api/trusted/v1/event/{self.key}/matches/delete",
-                data=dumps(data),
-            )
-        )
+        self._post_update("matches/delete", data)
 
     def update_team_list(self, data: typing.List[str]) -> None:
         """
@@ -792,13 +1048,7 @@ class Event(BaseSchema):
         Parameters:
             data (list[str]): List containing the keys of each team at the event.
         """
-        InternalData.loop.run_until_complete(
-            InternalData.post(
-                self,
-                url=f"https://www.thebluealliance.com/api/trusted/v1/event/{self.key}/team_list/update",
-                data=dumps(data),
-            )
-        )
+        self._post_update("team_list/update", data)
 
     def update_match_videos(self, data: dict) -> None:
         """
@@ -806,13 +1056,7 @@ class Event(BaseSchema):
         Parameters:
             data (dict): Mapping of partial match keys (i.e. qm1) to YouTube video IDs.
         """
-        InternalData.loop.run_until_complete(
-            InternalData.post(
-                self,
-                url=f"https://www.thebluealliance.com/api/trusted/v1/event/{self.key}/match_videos/add",
-                data=dumps(data),
-            )
-        )
+        self._post_update("match_videos/add", data)
 
     def update_media(self, data: typing.List[str]) -> None:
         """
@@ -820,18 +1064,14 @@ class Event(BaseSchema):
         Parameters:
             data (list[str]): List of YouTube video IDs to add as media for an event.
         """
-        InternalData.loop.run_until_complete(
-            InternalData.post(
-                self,
-                url=f"https://www.thebluealliance.com/api/trusted/v1/event/{self.key}/media/add",
-                data=dumps(data),
-            )
-        )
+        self._post_update("media/add", data)
 
 
 class Team(BaseSchema):
     """Class representing a team's metadata with methods to get team specific data.
 
+    The matches and OPRs that `min`, `max`, `top_k` and `average` are computed from are memoized on the instance for as long as the responses they came from are cached (see `InternalData.CACHE_TTLS`), unless `use_caching` or `etag` is passed in. Call `invalidate_cache` to retrieve them again sooner.
+
     Attributes:
         key (str): TBA team key with the format frcXXXX with XXXX representing the team number.
         team_number (int): Official team number issued by FIRST.
@@ -854,74 +1094,65 @@ class Team(BaseSchema):
         home_championship (dict, optional): Location of the team's home championship each year as a key-value pair. The year (as a string) is the key, and the city is the value.
     """  # noqa
 
+    _locations: typing.Dict[str, typing.Optional[typing.Tuple[float, float]]] = {}
+    _OPTIONAL_FIELDS = (
+        "nickname",
+        "name",
+        "school_name",
+        "city",
+        "state_prov",
+        "country",
+        "address",
+        "postal_code",
+        "gmaps_place_id",
+        "gmaps_url",
+        "lat",
+        "lng",
+        "location_name",
+        "rookie_year",
+        "home_championship",
+    )
+
     def __init__(self, *args, **kwargs):
-        if len(args) == 2:
-            if isinstance(args[0], int) and isinstance(args[1], str):
-                self.key = f"{args[1]}{args[0]}"
-                self.team_number = args[0]
-            elif isinstance(args[0], str) and isinstance(args[1], int):
-                self.key = f"{args[0]}{args[1]}"
-                self.team_number = args[1]
+        if not args:
+            # Teams built from API responses only pass keyword arguments, so this is checked first.
+            self._set_attributes(kwargs)
         elif len(args) == 1:
-            if isinstance(args[0], int):
-                self.key = f"frc{args[0]}"
+            (team_number_or_key,) = args
+
+            if isinstance(team_number_or_key, int):
+                self._set_attributes({**kwargs, "key": f"frc{team_number_or_key}", "team_number": team_number_or_key})
             else:
-                (self.key,) = args
-            self.team_number: int = int(self.key[3:])
+                self._set_attributes({**kwargs, "key": team_number_or_key})
+        elif len(args) == 2 and isinstance(args[0], int) and isinstance(args[1], str):
+            self._set_attributes({**kwargs, "key": f"{args[1]}{args[0]}", "team_number": args[0]})
+        elif len(args) == 2 and isinstance(args[0], str) and isinstance(args[1], int):
+            self._set_attributes({**kwargs, "key": f"{args[0]}{args[1]}", "team_number": args[1]})
         else:
-            self.key: str = kwargs["key"]
-            self.team_number: int = kwargs.get("team_number") or int(self.key[3:])
-
-        self.nickname: typing.Optional[str] = kwargs.get("nickname")
-        self.name: typing.Optional[int] = kwargs.get("name")
-        self.school_name: typing.Optional[str] = kwargs.get("school_name")
-        self.city: typing.Optional[str] = kwargs.get("city")
-        self.state_prov: typing.Optional[str] = kwargs.get("state_prov")
-        self.country: typing.Optional[str] = kwargs.get("country")
-        self.address: typing.Optional[str] = kwargs.get("address")
-        self.postal_code: typing.Optional[int] = kwargs.get("postal_code")
-        self.gmaps_place_id: typing.Optional[str] = kwargs.get("gmaps_place_id")
-        self.gmaps_url: typing.Optional[str] = kwargs.get("gmaps_url")
-        self.lat: typing.Optional[float] = kwargs.get("lat")
-        self.lng: typing.Optional[float] = kwargs.get("lng")
-        self.location_name: typing.Optional[float] = kwargs.get("location_name")
-        self.rookie_year: typing.Optional[int] = kwargs.get("rookie_year")
-        self.home_championship: typing.Optional[dict] = kwargs.get("home_championship")
+            raise TypeError(
+                "A team can only be created from its key or team number, or its team number (int) and 'frc'."
+            )
 
         super().__init__()
 
-    # Copied over from other classes in main_schemas.py as autocomplete fails to work
-    # when the decorator is defined in another class.
-    def _caching_headers(func: typing.Callable) -> typing.Callable:
-        """Decorator for utilizing the `Etag` and `If-None-Match` caching headers for the TBA API."""
-
-        @functools.wraps(func)
-        def wrapper(
-            self, *args, use_caching: bool = False, etag: str = "", silent: bool = False, **kwargs
-        ) -> typing.Any:
-            """Wrapper for adding headers to cache the results from the TBA API."""
-
-            self.use_caching = use_caching
-            self.silent = silent
-
-            self.etag = etag or self.etag
-
-            try:
-                return func(self, *args, **kwargs)
-            except aiohttp.ContentTypeError:
-                if not silent:
-                    raise NotModifiedSinceError from None
-                else:
-                    return_type = str(func.__annotations__["return"]).lower()
+    def _set_attributes(self, data: dict) -> None:
+        """
+        Sets all of the attributes of a team.
 
-                    if "list" in return_type:
-                        return []
-                    elif "dict" in return_type:  # pragma: no cover
-                        return {}
+        Args:
+            data (dict): A dictionary containing the team's data, which must include the team's key.
+        """
+        key = data["key"]
+        self.key: str = key
+        self.team_number: int = data.get("team_number") or int(key[3:], 10)
+        self.__dict__.update({field: data.get(field) for field in self._OPTIONAL_FIELDS})
 
-        return wrapper
+    @functools.cached_property
+    def _base_url(self) -> str:
+        """The URL that all of the endpoints relating to this team are appended onto."""
+        return construct_url("team", key=self.key)
 
-    @_caching_headers
+    @caching_headers
     async def _get_year_events(
         self, year: int, simple: bool, keys: bool, statuses: bool
     ) -> typing.Union[typing.List[typing.Union[str, Event]], typing.Dict[str, EventTeamStatus]]:
@@ -939,15 +1170,13 @@ class Team(BaseSchema):
         """  # noqa
         response = await InternalData.get(
             current_instance=self,
-            url=construct_url(
-                "team", key=self.key, endpoint="events", year=year, simple=simple, keys=keys, statuses=statuses
-            ),
+            url=f"{self._base_url}/events" + url_suffix(year=year, simple=simple, keys=keys, statuses=statuses),
             headers=self._headers,
         )
         if keys:
             return response
         elif not statuses:
-            return [Event(**event_data) for event_data in response]
+            return Event.from_many(response)
         else:
             return {
                 event_key: EventTeamStatus(event_key, team_status_info)
@@ -955,7 +1184,7 @@ class Team(BaseSchema):
                 if team_status_info
             }
 
-    @_caching_headers
+    @caching_headers
     async def _get_year_matches(
         self, year: int, event_code: typing.Optional[str], simple: bool, keys: bool
     ) -> typing.List[Match]:
@@ -973,21 +1202,27 @@ class Team(BaseSchema):
         """  # noqa
         response = await InternalData.get(
             current_instance=self,
-            url=construct_url("team", key=self.key, endpoint="matches", year=year, simple=simple, keys=keys),
+            url=f"{self._base_url}/matches" + url_suffix(year=year, simple=simple, keys=keys),
             headers=self._headers,
         )
+        # Match keys are structured as `{event_key}_{match}` and event keys as `{year}{event_code}`, so the event
+        # code is matched against the start of the key (which still lets partial codes like 'ir' match 2022iri).
+        event_key_prefix = f"{year}{event_code}"
+
         if keys:
             if event_code:
-                return [match_key for match_key in response if event_code in match_key]
+                return [match_key for match_key in response if match_key.startswith(event_key_prefix)]
             else:
                 return response
         else:
             if event_code:
-                return [Match(**match_data) for match_data in response if event_code in match_data["event_key"]]
+                return Match.from_many(
+                    match_data for match_data in response if match_data["event_key"].startswith(event_key_prefix)
+                )
             else:
-                return [Match(**match_data) for match_data in response]
+                return Match.from_many(response)
 
-    @_caching_headers
+    @caching_headers
     async def _get_year_media(self, year: int, media_tag: typing.Optional[str] = None) -> typing.List[Media]:
         """
         Retrieves all the media of a certain team from a certain year and based off the media_tag if passed in.
@@ -1000,16 +1235,32 @@ class Team(BaseSchema):
             typing.List[falcon_alliance.Media]: A list of Media objects representing individual media from a team during a year.
         """  # noqa
         if media_tag:
-            url = construct_url(
-                "team", key=self.key, endpoint="media", second_endpoint="tag", media_tag=media_tag, year=year
-            )
+            url = f"{self._base_url}/media/tag/{media_tag}" + url_suffix(year=year)
         else:
-            url = construct_url("team", key=self.key, endpoint="media", year=year)
+            url = f"{self._base_url}/media" + url_suffix(year=year)
 
         response = await InternalData.get(current_instance=self, url=url, headers=self._headers)
-        return [Media(**media_data) for media_data in response]
+        return Media.from_many(response)
+
+    @staticmethod
+    def _gather_years(coroutines: typing.Iterable[typing.Awaitable[list]]) -> list:
+        """
+        Runs the coroutines retrieving data from each year concurrently and flattens their results into a single list.
+
+        Args:
+            coroutines (typing.Iterable[typing.Awaitable[list]]): The coroutines retrieving data from each year, such as calls to `Team._get_year_matches`.
+
+        Returns:
+            list: A list containing the results of every coroutine, in the order the coroutines were passed in.
+        """  # noqa
+        results = []
+
+        for year_results in InternalData.loop.run_until_complete(asyncio.gather(*coroutines)):
+            results.extend(year_results)
+
+        return results
 
-    @_caching_headers
+    @caching_headers
     def awards(self, year: typing.Optional[typing.Union[range, int]] = None) -> typing.List[Award]:
         """
         Retrieves all awards a team has gotten either during its career or during certain year(s).
@@ -1023,30 +1274,29 @@ class Team(BaseSchema):
         response = InternalData.loop.run_until_complete(
             InternalData.get(
                 current_instance=self,
-                url=construct_url(
-                    "team", key=self.key, endpoint="awards", year=year if isinstance(year, int) else False
-                ),
+                url=f"{self._base_url}/awards" + url_suffix(year=year if isinstance(year, int) else False),
                 headers=self._headers,
             )
         )
         if isinstance(year, range):
-            return [Award(**award_data) for award_data in response if award_data["year"] in year]
+            year_contains = year.__contains__
+            return Award.from_many(award_data for award_data in response if year_contains(award_data["year"]))
         else:
-            return [Award(**award_data) for award_data in response]
+            return Award.from_many(response)
 
-    @_caching_headers
+    @caching_headers
     def years_participated(self) -> typing.List[int]:
         """Returns all the years this team has participated in."""
         response = InternalData.loop.run_until_complete(
             InternalData.get(
                 current_instance=self,
-                url=construct_url("team", key=self.key, endpoint="years_participated"),
+                url=f"{self._base_url}/years_participated",
                 headers=self._headers,
             )
         )
         return response
 
-    @_caching_headers
+    @caching_headers
     def districts(self) -> typing.List[District]:
         """
         Retrieves a list of districts representing each year this team was in said district.
@@ -1059,13 +1309,13 @@ class Team(BaseSchema):
         response = InternalData.loop.run_until_complete(
             InternalData.get(
                 current_instance=self,
-                url=construct_url("team", key=self.key, endpoint="districts"),
+                url=f"{self._base_url}/districts",
                 headers=self._headers,
             )
         )
-        return [District(**district_data) for district_data in response]
+        return District.from_many(response)
 
-    @_caching_headers
+    @caching_headers
     def matches(
         self,
         year: typing.Union[range, int],
@@ -1078,7 +1328,7 @@ class Team(BaseSchema):
 
         Args:
             year (int, range): An integer representing the year to retrieve a team's matches from or a range object representing all the years matches a team played should be retrieved from.
-            event_code (str): A string representing the code of an event (the latter half of a key, eg 'iri' instead of '2022iri'). Used for filtering matches a team played to only those in a certain event. Can be None if all matches a team played want to be retrieved.
+            event_code (str): A string representing the code of an event (the latter half of a key, eg 'iri' instead of '2022iri'). Used for filtering matches a team played to only those in a certain event, matching events whose code starts with it (eg 'ir' matches 'iri', but 'ri' doesn't). Can be None if all matches a team played want to be retrieved.
             simple (bool): A boolean representing whether each match's information should be stripped to only contain relevant information. Can be False if `simple` isn't passed in.
             keys (bool): A boolean representing whether only the keys of the matches a team played from said year should be returned. Can be False if `keys` isn't passed in.
 
@@ -1089,25 +1339,17 @@ class Team(BaseSchema):
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
 
         if isinstance(year, range):
-            return list(
-                itertools.chain.from_iterable(
-                    InternalData.loop.run_until_complete(
-                        asyncio.gather(
-                            *[
-                                self._get_year_matches(
-                                    spec_year,
-                                    event_code,
-                                    simple,
-                                    keys,
-                                    use_caching=self.use_caching,
-                                    etag=self.etag,
-                                    silent=self.silent,
-                                )
-                                for spec_year in year
-                            ]
-                        )
-                    )
+            return self._gather_years(
+                self._get_year_matches(
+                    spec_year,
+                    event_code,
+                    simple,
+                    keys,
+                    use_caching=self.use_caching,
+                    etag=self.etag,
+                    silent=self.silent,
                 )
+                for spec_year in year
             )
         else:
             return InternalData.loop.run_until_complete(
@@ -1116,7 +1358,7 @@ class Team(BaseSchema):
                 )
             )
 
-    @_caching_headers
+    @caching_headers
     def media(self, year: typing.Union[range, int], media_tag: typing.Optional[str] = None) -> typing.List[Media]:
         """
         Retrieves all the media of a certain team based off the parameters.
@@ -1129,30 +1371,22 @@ class Team(BaseSchema):
             typing.List[falcon_alliance.Media]: A list of Media objects representing individual media from a team.
         """  # noqa
         if isinstance(year, range):
-            return list(
-                itertools.chain.from_iterable(
-                    InternalData.loop.run_until_complete(
-                        asyncio.gather(
-                            *[
-                                self._get_year_media(
-                                    spec_year,
-                                    media_tag,
-                                    use_caching=self.use_caching,
-                                    etag=self.etag,
-                                    silent=self.silent,
-                                )
-                                for spec_year in year
-                            ]
-                        )
-                    )
+            return self._gather_years(
+                self._get_year_media(
+                    spec_year,
+                    media_tag,
+                    use_caching=self.use_caching,
+                    etag=self.etag,
+                    silent=self.silent,
                 )
+                for spec_year in year
             )
         else:
             return InternalData.loop.run_until_complete(
                 self._get_year_media(year, media_tag, use_caching=self.use_caching, etag=self.etag, silent=self.silent)
             )
 
-    @_caching_headers
+    @caching_headers
     def robots(self) -> typing.List[Robot]:
         """
         Retrieves a list of robots representing each robot for every year the team has played if they named the robot.
@@ -1163,13 +1397,11 @@ class Team(BaseSchema):
             typing.List[falcon_alliance.Robot]: A list of robots representing each year a team has registered its robot onto TBA, if a team hasn't named a robot before it returns an empty list.
         """  # noqa
         response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self, url=construct_url("team", key=self.key, endpoint="robots"), headers=self._headers
-            )
+            InternalData.get(current_instance=self, url=f"{self._base_url}/robots", headers=self._headers)
         )
         return [Robot(**robot_data) for robot_data in response]
 
-    @_caching_headers
+    @caching_headers
     def events(
         self,
         year: typing.Union[range, int] = None,
@@ -1189,38 +1421,24 @@ class Team(BaseSchema):
         Returns:
             typing.Union[typing.List[typing.Union[falcon_alliance.Event, str]], typing.Dict[str, falcon_alliance.EventTeamStatus]]: A list of Event objects for each event that was returned or a list of strings representing the keys of the events or a dictionary with team keys as the keys of the dictionary and an EventTeamStatus object representing the status of said team as the values of the dictionary.
         """  # noqa
-        if simple and keys:
-            raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
-        elif statuses and (simple or keys):
-            raise ValueError(
-                "statuses cannot be True in conjunction with simple or keys,"
-                " if statuses is True then simple and keys must be False."
-            )
-        elif statuses and not year:
-            raise ValueError("statuses cannot be True if a year isn't passed into Team.events.")
-        elif statuses and isinstance(year, range):
-            raise ValueError("statuses cannot be True when year is a range object.")
+        validation_error = _TEAM_EVENTS_VALIDATION[
+            bool(simple), bool(keys), bool(statuses), not year, isinstance(year, range)
+        ]
+        if validation_error:
+            raise ValueError(validation_error)
 
         if isinstance(year, range):
-            return list(
-                itertools.chain.from_iterable(
-                    InternalData.loop.run_until_complete(
-                        asyncio.gather(
-                            *[
-                                self._get_year_events(
-                                    spec_year,
-                                    simple,
-                                    keys,
-                                    statuses,
-                                    use_caching=self.use_caching,
-                                    etag=self.etag,
-                                    silent=self.silent,
-                                )
-                                for spec_year in year
-                            ]
-                        )
-                    )
+            return self._gather_years(
+                self._get_year_events(
+                    spec_year,
+                    simple,
+                    keys,
+                    statuses,
+                    use_caching=self.use_caching,
+                    etag=self.etag,
+                    silent=self.silent,
                 )
+                for spec_year in year
             )
         else:
             return InternalData.loop.run_until_complete(
@@ -1229,8 +1447,8 @@ class Team(BaseSchema):
                 )
             )
 
-    @_caching_headers
-    def event(
+    @caching_headers
+    async def event_async(
         self,
         event_key: str,
         *,
@@ -1241,7 +1459,7 @@ class Team(BaseSchema):
         status: bool = False,
     ) -> typing.Union[typing.List[Award], EventTeamStatus, typing.List[typing.Union[Match, str]]]:
         """
-        Retrieves and returns a record of teams based on the parameters given.
+        Coroutine version of `Team.event`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
 
         Args:
             event_key (str): An event key (a unique key specific to one event) to retrieve data from.
@@ -1254,63 +1472,139 @@ class Team(BaseSchema):
         Returns:
             typing.Union[typing.List[falcon_alliance.Award], falcon_alliance.EventTeamStatus, typing.List[typing.Union[falcon_alliance.Match, str]]]: A list of Match objects representing each match a team played or an EventTeamStatus object to represent the team's status during an event or a list of strings representing the keys of the matches the team played in or a list of Award objects to represent award(s) a team got during an event.
         """  # noqa
-        if not awards and not matches and not status:
-            raise ValueError("Either awards, matches or status must be True for this function.")
-        elif simple and keys:
-            raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
-        elif awards and (simple or keys or matches):
-            raise ValueError(
-                "awards cannot be True in conjunction with simple, keys or matches, "
-                "if awards is True then simple, keys, and matches must be False."
-            )
-        elif status and (simple or keys or matches):
-            raise ValueError(
-                "status cannot be True in conjunction with simple, keys or matches "
-                "if statuses is True then simple, keys, and matches must be False."
-            )
+        validation_error = _TEAM_EVENT_VALIDATION[bool(awards), bool(matches), bool(simple), bool(keys), bool(status)]
+        if validation_error:
+            raise ValueError(validation_error)
 
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url(
-                    "team",
-                    key=self.key,
-                    endpoint="event",
-                    event_key=event_key,
-                    awards=awards,
-                    matches=matches,
-                    status=status,
-                    simple=simple,
-                    keys=keys,
-                ),
-                headers=self._headers,
-            )
+        response = await InternalData.get(
+            current_instance=self,
+            url=f"{self._base_url}/event/{event_key}"
+            + url_suffix(awards=awards, matches=matches, status=status, simple=simple, keys=keys),
+            headers=self._headers,
         )
         if matches and keys:
             return response
         elif matches:
-            return [Match(**match_data) for match_data in response]
+            return Match.from_many(response)
         elif awards:
-            return [Award(**award_data) for award_data in response]
+            return Award.from_many(response)
         else:
             return EventTeamStatus(event_key, response)
 
-    @_caching_headers
-    def social_media(self) -> typing.List[Media]:
+    def event(
+        self,
+        event_key: str,
+        *,
+        awards: bool = False,
+        matches: bool = False,
+        simple: bool = False,
+        keys: bool = False,
+        status: bool = False,
+        **kwargs,
+    ) -> typing.Union[typing.List[Award], EventTeamStatus, typing.List[typing.Union[Match, str]]]:
+        """
+        Retrieves and returns a record of teams based on the parameters given.
+
+        Args:
+            event_key (str): An event key (a unique key specific to one event) to retrieve data from.
+            awards (bool): A boolean that specifies whether the awards a team got during a match should be retrieved. Cannot be True in conjunction with `matches`.
+            matches (bool): A boolean that specifies whether the matches a team played in during an event should be retrieved. Cannot be True in conjunction with `awards`.
+            simple (bool): A boolean that specifies whether the results for each event's matches should be 'shortened' and only contain more relevant information. Do note that `simple` should only be True in conjunction with `matches`.
+            keys (bool): A boolean that specifies whether only the keys of the matches the team played should be returned. Do note that `keys` should only be True in conjunction with `matches`
+            status (bool): A boolean that specifies whether a key/value pair of the status of the team during an event should be returned. `status` should only be the only boolean out of the parameters that is True when using it.
+
+        Returns:
+            typing.Union[typing.List[falcon_alliance.Award], falcon_alliance.EventTeamStatus, typing.List[typing.Union[falcon_alliance.Match, str]]]: A list of Match objects representing each match a team played or an EventTeamStatus object to represent the team's status during an event or a list of strings representing the keys of the matches the team played in or a list of Award objects to represent award(s) a team got during an event.
+        """  # noqa
+        return InternalData.loop.run_until_complete(
+            self.event_async(
+                event_key, awards=awards, matches=matches, simple=simple, keys=keys, status=status, **kwargs
+            )
+        )
+
+    @caching_headers
+    async def social_media_async(self) -> typing.List[Media]:
+        """
+        Coroutine version of `Team.social_media`, for retrieving data concurrently with other coroutines by passing it into `fetch_many`.
+
+        Returns:
+            typing.List[falcon_alliance.Media]: A list of Media objects representing each social media account of a team. May be empty if a team has no social media accounts.
+        """  # noqa
+        response = await InternalData.get(
+            current_instance=self, url=f"{self._base_url}/social_media", headers=self._headers
+        )
+        return Media.from_many(response)
+
+    def social_media(self, **kwargs) -> typing.List[Media]:
         """
         Retrieves all social media accounts of a team registered on TBA.
 
         Returns:
             typing.List[falcon_alliance.Media]: A list of Media objects representing each social media account of a team. May be empty if a team has no social media accounts.
         """  # noqa
-        response = InternalData.loop.run_until_complete(
-            InternalData.get(
-                current_instance=self,
-                url=construct_url("team", key=self.key, endpoint="social_media"),
-                headers=self._headers,
-            )
+        return InternalData.loop.run_until_complete(self.social_media_async(**kwargs))
+
+    def _match_scores(
+        self, year: typing.Union[range, int], event_code: typing.Optional[str], simple: bool = False
+    ) -> typing.List[typing.Tuple[int, Match]]:
+        """
+        Retrieves the score of this team's alliance in each match it played during certain year(s), memoizing the result on this instance.
+
+        Args:
+            year (range, int): An integer representing the year to retrieve scores from or a range object representing the years to retrieve scores from.
+            event_code (str, optional): A string representing the code of an event to only retrieve scores from, can be None to retrieve scores from all events.
+            simple (bool): A boolean representing whether the much smaller simple matches should be retrieved, for when only the scores are needed rather than the matches themselves.
+
+        Returns:
+            typing.List[typing.Tuple[int, falcon_alliance.Match]]: A list of tuples containing the score of this team's alliance and the match it was from.
+        """  # noqa
+        cache_key = ("match_scores", year, event_code, simple)
+        match_scores = self._memoized(cache_key)
+        if match_scores is not None:
+            return match_scores
+
+        team_key = self.key
+        team_matches = self.matches(year, event_code, simple=simple)
+        match_scores = [(team_match.alliance_of(team_key).score, team_match) for team_match in team_matches]
+        self._memoize(cache_key, match_scores, f"{self._base_url}/matches")
+
+        return match_scores
+
+    def _collect_oprs(
+        self, year: typing.Union[range, int], metric: Metrics
+    ) -> typing.Tuple[typing.List[float], typing.List[Event]]:
+        """
+        Retrieves the OPR/DPR/CCWM of this team at each event it attended during certain year(s), memoizing the result on this instance.
+
+        Args:
+            year (range, int): An integer representing the year to retrieve the metric from or a range object representing the years to retrieve the metric from.
+            metric (Metrics): An Enum object representing which metric out of Metrics.OPR, Metrics.DPR and Metrics.CCWM to retrieve.
+
+        Returns:
+            typing.Tuple[typing.List[float], typing.List[falcon_alliance.Event]]: Two parallel lists containing the values of the metric for this team and the events they were from, skipping events where the metric wasn't calculated.
+        """  # noqa
+        cache_key = ("collect_oprs", year, metric)
+        collected_oprs = self._memoized(cache_key)
+        if collected_oprs is not None:
+            return collected_oprs
+
+        opr_values = []
+        opr_events = []
+        team_events = self.events(year)
+        all_event_oprs = InternalData.loop.run_until_complete(
+            asyncio.gather(*[event.oprs_async() for event in team_events])
         )
-        return [Media(**social_media_info) for social_media_info in response]
+
+        for event, event_oprs in zip(team_events, all_event_oprs):
+            event_oprs = _METRIC_ATTR[metric](event_oprs)
+
+            if event_oprs:
+                opr_values.append(event_oprs[self.key])
+                opr_events.append(event)
+
+        self._memoize(cache_key, (opr_values, opr_events), construct_url("event", key=self.key) + "/oprs")
+
+        return opr_values, opr_events
 
     def min(
         self, year: typing.Union[range, int], metric: Metrics, *, event_code: typing.Optional[str] = None
@@ -1327,21 +1621,15 @@ class Team(BaseSchema):
             typing.Union[Match, tuple[float, falcon_alliance.Event]]: A Match object representing the match with the minimum score if Metrics.MATCH_SCORE is passed into `metric` or a tuple containing the minimum OPR/DPR/CCWM for a team and the event where the team had said minimum OPR/DPR/CCWM if Metrics.OPR, Metrics.DPR or Metrics.CCWM is passed into `metric`.
         """  # noqa
         if metric == Metrics.MATCH_SCORE:
-            team_matches = self.matches(year, event_code) if event_code else self.matches(year)
-            return min(team_matches, key=lambda match: match.alliance_of(self.key).score)
-        elif metric in {Metrics.OPR, Metrics.DPR, Metrics.CCWM}:
+            _, minimum_match = min(self._match_scores(year, event_code), key=operator.itemgetter(0))
+            return minimum_match
+        elif metric in _OPR_METRICS:
             if event_code:  # pragma: no cover
                 raise ValueError(f"`event_code` parameter incompatible with the metric {metric}.")
 
-            team_oprs = []
-
-            for event in self.events(year):
-                event_oprs = event.oprs()
-
-                if getattr(event_oprs, f"{metric.name.lower()}s"):
-                    team_oprs.append((getattr(event_oprs, f"{metric.name.lower()}s")[self.key], event))
-
-            return min(team_oprs, key=lambda tup: tup[0])
+            opr_values, opr_events = self._collect_oprs(year, metric)
+            index = min(range(len(opr_values)), key=opr_values.__getitem__)
+            return opr_values[index], opr_events[index]
         else:  # pragma: no cover
             raise ValueError(f"{metric} incompatible with `Team.min`.")
 
@@ -1360,23 +1648,61 @@ class Team(BaseSchema):
             typing.Union[Match, tuple[float, falcon_alliance.Event]]: A Match object representing the match with the maximum score if Metrics.MATCH_SCORE is passed into `metric` or a tuple containing the maximum OPR/DPR/CCWM for a team and the event where the team had said maximum OPR/DPR/CCWM if Metrics.OPR, Metrics.DPR or Metrics.CCWM is passed into `metric`.
         """  # noqa
         if metric == Metrics.MATCH_SCORE:
-            team_matches = self.matches(year, event_code) if event_code else self.matches(year)
-            return max(team_matches, key=lambda match: match.alliance_of(self.key).score)
-        elif metric in {Metrics.OPR, Metrics.DPR, Metrics.CCWM}:
+            _, maximum_match = max(self._match_scores(year, event_code), key=operator.itemgetter(0))
+            return maximum_match
+        elif metric in _OPR_METRICS:
             if event_code:  # pragma: no cover
                 raise ValueError(f"`event_code` parameter incompatible with the metric {metric}.")
 
-            team_oprs = []
+            opr_values, opr_events = self._collect_oprs(year, metric)
+            index = max(range(len(opr_values)), key=opr_values.__getitem__)
+            return opr_values[index], opr_events[index]
+        else:  # pragma: no cover
+            raise ValueError(f"{metric} incompatible with `Team.max`.")
 
-            for event in self.events(year):
-                event_oprs = event.oprs()
+    def top_k(
+        self,
+        year: typing.Union[range, int],
+        metric: Metrics,
+        k: int,
+        *,
+        kind: str = "max",
+        event_code: typing.Optional[str] = None,
+    ) -> typing.Union[typing.List[Match], typing.List[typing.Tuple[float, Event]]]:
+        """
+        Retrieves the `k` highest (or lowest) results of a certain metric based on the year, from best to worst.
 
-                if getattr(event_oprs, f"{metric.name.lower()}s"):
-                    team_oprs.append((getattr(event_oprs, f"{metric.name.lower()}s")[self.key], event))
+        Args:
+            year (range, int): An integer representing the year to apply the metric to or a range object representing the years to apply the metric to.
+            metric (Metrics): An Enum object representing which metric to use to rank something relating to a team of your desire.
+            k (int): An integer representing how many results to retrieve.
+            kind (str): "max" to retrieve the highest results or "min" to retrieve the lowest results.
+            event_code(str, optional): A string representing which event to apply a certain metric to for ranking based on said metric (optional).
 
-            return max(team_oprs, key=lambda tup: tup[0])
+        Returns:
+            typing.Union[typing.List[Match], typing.List[tuple[float, falcon_alliance.Event]]]: A list of Match objects representing the matches with the highest/lowest scores if Metrics.MATCH_SCORE is passed into `metric` or a list of tuples containing the highest/lowest OPRs/DPRs/CCWMs for a team and the events where the team had said OPR/DPR/CCWM if Metrics.OPR, Metrics.DPR or Metrics.CCWM is passed into `metric`.
+        """  # noqa
+        if kind == "max":
+            select_top = heapq.nlargest
+        elif kind == "min":
+            select_top = heapq.nsmallest
         else:  # pragma: no cover
-            raise ValueError(f"{metric} incompatible with `Team.max`.")
+            raise ValueError(f"`kind` must be either 'min' or 'max', not {kind!r}.")
+
+        if metric == Metrics.MATCH_SCORE:
+            top_scores = select_top(k, self._match_scores(year, event_code), key=operator.itemgetter(0))
+            return [top_match for _, top_match in top_scores]
+        elif metric in _OPR_METRICS:
+            if event_code:  # pragma: no cover
+                raise ValueError(f"`event_code` parameter incompatible with the metric {metric}.")
+
+            opr_values, opr_events = self._collect_oprs(year, metric)
+            return [
+                (opr_values[index], opr_events[index])
+                for index in select_top(k, range(len(opr_values)), key=opr_values.__getitem__)
+            ]
+        else:  # pragma: no cover
+            raise ValueError(f"{metric} incompatible with `Team.top_k`.")
 
     def average(
         self, year: typing.Union[range, int], metric: Metrics, *, event_code: typing.Optional[str] = None
@@ -1393,21 +1719,14 @@ class Team(BaseSchema):
             float: A float representing the average match score if Metrics.MATCH_SCORE is passed into `metric` or a float representing the average OPR/DPR/CCWM of a team for a certain year.
         """  # noqa
         if metric == Metrics.MATCH_SCORE:
-            team_matches = self.matches(year, event_code) if event_code else self.matches(year)
-            return statistics.mean([match.alliance_of(self).score for match in team_matches])
-        elif metric in {Metrics.OPR, Metrics.DPR, Metrics.CCWM}:
+            # Only the scores are needed, so the much smaller simple matches are retrieved.
+            return statistics.fmean(score for score, _ in self._match_scores(year, event_code, simple=True))
+        elif metric in _OPR_METRICS:
             if event_code:  # pragma: no cover
                 raise ValueError(f"`event_code` parameter incompatible with the metric {metric}.")
 
-            team_oprs = []
-
-            for event in self.events(year):
-                event_oprs = event.oprs()
-
-                if getattr(event_oprs, f"{metric.name.lower()}s"):
-                    team_oprs.append(getattr(event_oprs, f"{metric.name.lower()}s")[self.key])
-
-            return statistics.mean(team_oprs)
+            opr_values, _ = self._collect_oprs(year, metric)
+            return statistics.fmean(opr_values)
         else:  # pragma: no cover
             raise ValueError(f"{metric} incompatible with `Team.average`.")
 
@@ -1415,29 +1734,42 @@ class Team(BaseSchema):
         """
         Retrieves the location of the team based on its postal code.
 
+        Locations are memoized for the lifetime of the process (including when a team couldn't be found), as a team's city, state/province and country don't change.
+
         Returns:
             typing.Optional[typing.Tuple[float, float]]: Returns a tuple containing the latitude and longitude or None if it couldn't find a location for the team.
         """  # noqa
         if self.city or self.state_prov or self.country:
-            if self.country in {"USA", "Canada"}:  # pragma: no cover
-                to_search = ", ".join([value for value in (self.city, self.state_prov, self.country) if value])
-            else:  # pragma: no cover
-                to_search = ", ".join([value for value in (self.city, self.country) if value])
+            # States/provinces are only included for the countries where they're needed to narrow down the search.
+            location_parts = (
+                (self.city, self.state_prov, self.country)
+                if self.country in {"USA", "Canada"}
+                else (self.city, self.country)
+            )
+            to_search = ", ".join(filter(None, location_parts))
 
+            if to_search in self._locations:
+                return self._locations[to_search]
+
+            # Nominatim only needs the one best match, and its usage policy requires an identifying User-Agent.
             geolocation = InternalData.loop.run_until_complete(
                 InternalData.get(
                     current_instance=self,
-                    url=f"https://nominatim.openstreetmap.org/search/{to_search}?format=json",
-                    headers=self._headers,
+                    url="https://nominatim.openstreetmap.org/search?"
+                    + urlencode({"q": to_search, "format": "json", "limit": 1}),
+                    headers=NOMINATIM_HEADERS,
                 )
             )
         else:
             return
 
         try:
-            return float(geolocation[0]["lat"]), float(geolocation[0]["lon"])
+            location = float(geolocation[0]["lat"]), float(geolocation[0]["lon"])
         except IndexError:  # when it can't find a location for the team.
-            return
+            location = None
+
+        self._locations[to_search] = location
+        return location
 
     def __hash__(self) -> int:
         return self.team_number
@@ -1,13 +1,13 @@
 import datetime
+import functools
 import typing
 from dataclasses import dataclass
 
 from falcon_alliance.schemas.base_schema import BaseSchema
+from falcon_alliance.utils import to_team_key
 
-try:
-    from falcon_alliance_utils import *  # noqa
-except ImportError:
-    from ..utils import *  # noqa
+if typing.TYPE_CHECKING:
+    from falcon_alliance.schemas.main_schemas import Team
 
 
 class Match(BaseSchema):
@@ -33,6 +33,9 @@ class Match(BaseSchema):
     class Alliance:
         """Class representing an alliance's performance/metadata during a match."""
 
+        # Declared by hand as `dataclass(slots=True)` requires Python 3.10, so only for dataclasses without defaults.
+        __slots__ = ("color", "score", "team_keys", "surrogate_team_keys", "dq_team_keys")
+
         color: typing.Union[typing.Literal["blue"], typing.Literal["red"]]
         score: typing.Optional[int]
         team_keys: typing.List[str]
@@ -43,6 +46,8 @@ class Match(BaseSchema):
     class ZebraMotionworks:
         """Class representing Zebra MotionWorks data for a team during a match."""
 
+        __slots__ = ("key", "times", "alliances")
+
         key: str
         times: typing.List[float]
         alliances: "Team"
@@ -51,51 +56,81 @@ class Match(BaseSchema):
         class Team:
             """Class representing a team's specific Zebra MotionWorks data during a match."""
 
+            __slots__ = ("team_key", "xs", "ys")
+
             team_key: str
             xs: list
             ys: list
 
         def __post_init__(self):
+            zebra_team = self.Team
             self.alliances = {
-                "red": [self.Team(**team) for team in self.alliances["red"]],
-                "blue": [self.Team(**team) for team in self.alliances["blue"]],
+                "red": [zebra_team(**team) for team in self.alliances["red"]],
+                "blue": [zebra_team(**team) for team in self.alliances["blue"]],
             }
 
+    _lazy_attributes = {
+        "_time": "time",
+        "_actual_time": "actual_time",
+        "_predicted_time": "predicted_time",
+        "_post_result_time": "post_result_time",
+    }
+
     def __init__(self, **kwargs):
-        self.key: str = kwargs["key"]
+        self._set_attributes(kwargs)
+        super().__init__()
 
-        self.comp_level: typing.Optional[str] = kwargs.get("comp_level")
-        self.set_number: typing.Optional[int] = kwargs.get("set_number")
+    def _set_attributes(self, data: dict) -> None:
+        """
+        Sets all of the attributes of a match.
 
-        self.match_number: typing.Optional[int] = kwargs.get("match_number")
+        Args:
+            data (dict): A dictionary containing the match's data.
+        """
+        self.key: str = data["key"]
+
+        self.comp_level: typing.Optional[str] = data.get("comp_level")
+        self.set_number: typing.Optional[int] = data.get("set_number")
+
+        self.match_number: typing.Optional[int] = data.get("match_number")
 
-        alliances = kwargs.get("alliances")
+        alliances = data.get("alliances")
         self.alliances: typing.Optional[dict] = {
             "red": self.Alliance(**alliances["red"], color="red"),
             "blue": self.Alliance(**alliances["blue"], color="blue"),
         }
-        self.winning_alliance: typing.Optional[str] = kwargs.get("winning_alliance")
+        self.winning_alliance: typing.Optional[str] = data.get("winning_alliance")
 
-        self.event_key: typing.Optional[str] = kwargs.get("event_key")
+        self.event_key: typing.Optional[str] = data.get("event_key")
 
-        time = kwargs.get("time")
-        actual_time = kwargs.get("actual_time")
-        predicted_time = kwargs.get("predicted_time")
-        post_result_time = kwargs.get("post_result_time")
+        # The timestamps are only converted into datetimes once they're accessed (see the properties below).
+        self._time: typing.Optional[int] = data.get("time")
+        self._actual_time: typing.Optional[int] = data.get("actual_time")
+        self._predicted_time: typing.Optional[int] = data.get("predicted_time")
+        self._post_result_time: typing.Optional[int] = data.get("post_result_time")
 
-        self.time: typing.Optional[datetime.datetime] = datetime.datetime.fromtimestamp(time) if time else None
-        self.actual_time: typing.Optional[int] = datetime.datetime.fromtimestamp(actual_time) if actual_time else None
-        self.predicted_time: typing.Optional[int] = (
-            datetime.datetime.fromtimestamp(predicted_time) if predicted_time else None
-        )
-        self.post_result_time: typing.Optional[int] = (
-            datetime.datetime.fromtimestamp(post_result_time) if post_result_time else None
-        )
+        self.score_breakdown: typing.Optional[dict] = data.get("score_breakdown")
+        self.videos: typing.Optional[list] = data.get("videos")
 
-        self.score_breakdown: typing.Optional[dict] = kwargs.get("score_breakdown")
-        self.videos: typing.Optional[list] = kwargs.get("videos")
+    @functools.cached_property
+    def time(self) -> typing.Optional[datetime.datetime]:
+        """The scheduled time of the match, as taken from the published schedule."""
+        return datetime.datetime.fromtimestamp(self._time) if self._time else None
 
-        super().__init__()
+    @functools.cached_property
+    def actual_time(self) -> typing.Optional[datetime.datetime]:
+        """The time the match actually started."""
+        return datetime.datetime.fromtimestamp(self._actual_time) if self._actual_time else None
+
+    @functools.cached_property
+    def predicted_time(self) -> typing.Optional[datetime.datetime]:
+        """The time TBA predicted the match would start."""
+        return datetime.datetime.fromtimestamp(self._predicted_time) if self._predicted_time else None
+
+    @functools.cached_property
+    def post_result_time(self) -> typing.Optional[datetime.datetime]:
+        """The time the result of the match was posted."""
+        return datetime.datetime.fromtimestamp(self._post_result_time) if self._post_result_time else None
 
     def alliance_of(self, team_key: typing.Union[int, str, "Team"]) -> typing.Optional[Alliance]:
         """
@@ -105,16 +140,18 @@ class Match(BaseSchema):
             team_key (int, str, falcon_alliance.Team): An integer representing the team number to search for in the alliance team keys or a string representing the team key to search for in the alliance team keys or a Team object representing the team to get the alliance of.
         """  # noqa
         team_key = to_team_key(team_key)
+        red_alliance, blue_alliance = self.alliances["red"], self.alliances["blue"]
 
-        if team_key in (
-            *self.alliances["red"].team_keys,
-            *self.alliances["red"].surrogate_team_keys,
-            *self.alliances["red"].dq_team_keys,
+        # Each list only has a few keys, so checking them one after another is faster than building a set to check.
+        if (
+            team_key in red_alliance.team_keys
+            or team_key in red_alliance.surrogate_team_keys
+            or team_key in red_alliance.dq_team_keys
         ):
-            return self.alliances["red"]
-        elif team_key in (
-            *self.alliances["blue"].team_keys,
-            *self.alliances["blue"].surrogate_team_keys,
-            *self.alliances["blue"].dq_team_keys,
+            return red_alliance
+        elif (
+            team_key in blue_alliance.team_keys
+            or team_key in blue_alliance.surrogate_team_keys
+            or team_key in blue_alliance.dq_team_keys
         ):
-            return self.alliances["blue"]
+            return blue_alliance
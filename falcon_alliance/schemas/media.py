@@ -16,13 +16,21 @@ class Media(BaseSchema):
     """
 
     def __init__(self, **kwargs):
-        self.type: typing.Optional[str] = kwargs.get("type")
-        self.foreign_key: typing.Optional[str] = kwargs.get("foreign_key")
+        self._set_attributes(kwargs)
+        super().__init__()
 
-        self.details: typing.Optional[dict] = kwargs.get("details")
-        self.preferred: typing.Optional[bool] = kwargs.get("preferred")
+    def _set_attributes(self, data: dict) -> None:
+        """
+        Sets all of the attributes of the media.
 
-        self.direct_url: typing.Optional[str] = kwargs.get("direct_url")
-        self.view_url: typing.Optional[str] = kwargs.get("view_url")
+        Args:
+            data (dict): A dictionary containing the data of the media.
+        """
+        self.type: typing.Optional[str] = data.get("type")
+        self.foreign_key: typing.Optional[str] = data.get("foreign_key")
 
-        super().__init__()
+        self.details: typing.Optional[dict] = data.get("details")
+        self.preferred: typing.Optional[bool] = data.get("preferred")
+
+        self.direct_url: typing.Optional[str] = data.get("direct_url")
+        self.view_url: typing.Optional[str] = data.get("view_url")
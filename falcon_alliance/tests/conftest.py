@@ -0,0 +1,123 @@
+import contextlib
+import hashlib
+import http
+import json
+import os
+import pathlib
+import typing
+
+import aiohttp
+import pytest
+
+from ..api_client import ApiClient
+from ..utils import InternalData
+
+# Directory the responses from TBA are recorded to, delete a recording (or the whole directory) to record it again.
+# It isn't committed, so responses that haven't been recorded yet are requested from TBA with the API key from the .env.
+RECORDINGS_DIR = pathlib.Path(__file__).parent / "recordings"
+
+
+class RecordedResponse:
+    """Class representing a response replayed from a recording, with the parts of `aiohttp.ClientResponse` used."""
+
+    def __init__(self, status: int, etag: str, body: str):
+        self.status = status
+        self.reason = http.HTTPStatus(status).phrase
+        self.headers = {"ETag": etag} if etag else {}
+        self._body = body
+
+    async def read(self) -> bytes:
+        """Retrieves the undecoded body of the response."""
+        return self._body.encode("utf8")
+
+    async def json(self, *, loads: typing.Callable = json.loads, **kwargs) -> typing.Union[list, dict]:
+        """Retrieves the body of the response decoded from JSON."""
+        return loads(self._body)
+
+
+def _recording_path(url: str) -> pathlib.Path:
+    """Retrieves the path of the file the response from the given URL is recorded to."""
+    return RECORDINGS_DIR / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.json"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def recorded_responses() -> typing.Iterator[typing.List[typing.Tuple[str, dict]]]:
+    """Replays responses from TBA that were recorded in a previous run instead of requesting them again, yielding the URL and headers of each GET request sent."""  # noqa
+    original_get = aiohttp.ClientSession.get
+    sent_requests = []
+
+    @contextlib.asynccontextmanager
+    async def get(self: aiohttp.ClientSession, url: str, **kwargs) -> typing.AsyncIterator[RecordedResponse]:
+        sent_requests.append((url, dict(kwargs.get("headers") or {})))
+        recording_path = _recording_path(url)
+
+        if not recording_path.exists():
+            async with original_get(self, url, **kwargs) as response:
+                recording = {
+                    "url": url,
+                    "status": response.status,
+                    "etag": response.headers.get("ETag", ""),
+                    "body": await response.text(),
+                }
+
+            # Errors (eg rate limiting or TBA being down) aren't recorded, so they're requested again in the next run.
+            if 200 <= recording["status"] < 300:
+                # Written to a temporary file first so tests running in parallel never read a partially written recording.
+                RECORDINGS_DIR.mkdir(exist_ok=True)
+                temporary_path = recording_path.with_suffix(f".{os.getpid()}.tmp")
+                temporary_path.write_text(json.dumps(recording))
+                os.replace(temporary_path, recording_path)
+        else:
+            recording = json.loads(recording_path.read_text())
+
+        # Revalidating with the recorded ETag behaves like TBA would if the data hadn't changed since.
+        if recording["etag"] and (kwargs.get("headers") or {}).get("If-None-Match") == recording["etag"]:
+            yield RecordedResponse(304, recording["etag"], "")
+        else:
+            yield RecordedResponse(recording["status"], recording["etag"], recording["body"])
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(aiohttp.ClientSession, "get", get)
+        yield sent_requests
+
+
+@pytest.fixture
+def sent_requests(recorded_responses: typing.List[typing.Tuple[str, dict]]) -> typing.List[typing.Tuple[str, dict]]:
+    """The URL and headers of each GET request sent to TBA during a test case, whether its response was recorded or not."""  # noqa
+    recorded_responses.clear()
+    return recorded_responses
+
+
+@pytest.fixture
+def empty_cache() -> typing.Iterator[None]:
+    """Starts a test case without any cached responses and clears the ones it cached afterwards, even if it fails."""
+    InternalData.clear_cache()
+    yield
+    InternalData.clear_cache()
+
+
+@pytest.fixture
+def rejected_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Answers requests to TBA's trusted (write) API locally like TBA does when the auth signature is invalid, for the test cases of the trusted API since they have no real auth secret."""  # noqa
+
+    @contextlib.asynccontextmanager
+    async def post(self: aiohttp.ClientSession, url: str, **kwargs) -> typing.AsyncIterator[RecordedResponse]:
+        yield RecordedResponse(401, "", json.dumps({"Error": "X-TBA-Auth-Sig is invalid."}))
+
+    monkeypatch.setattr(aiohttp.ClientSession, "post", post)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_session() -> typing.Iterator[None]:
+    """Keeps the session open across test cases so its connections to TBA are reused instead of being reopened."""
+
+    async def keep_session_open(self: ApiClient) -> None:
+        pass
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(ApiClient, "_close", keep_session_open)
+        yield
+
+    if InternalData.session is not None:
+        InternalData.loop.run_until_complete(InternalData.session.close())
+        InternalData.session = None
@@ -32,6 +32,23 @@ def test_district_kwargs():
         assert chs_district.year == 2022 and chs_district.abbreviation == "chs" and chs_district.key == "2022chs"
 
 
+@pytest.mark.parametrize("args", [("2022", "chs"), (2022, 2022)])
+def test_district_invalid_arguments(args: tuple):
+    """Tests that initializing `District` with two positional arguments that aren't a year and abbreviation raises an error."""  # noqa
+    with ApiClient():
+        with pytest.raises(TypeError):
+            District(*args)
+
+
+def test_district_from_dict():
+    """Tests `District.from_dict` with ensuring that it creates the same district as passing the data in as keyword arguments."""
+    district_data = {"key": "2022chs", "abbreviation": "chs", "year": 2022, "display_name": "Chesapeake"}
+
+    with ApiClient():
+        chs_district = District.from_dict(district_data)
+        assert chs_district == District(**district_data) and chs_district.display_name == "Chesapeake"
+
+
 def test_district_events():
     """Tests TBA's endpoint to retrieve all events that occurred in a district."""
     with ApiClient():
@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 
 from ..api_client import ApiClient
@@ -5,6 +7,12 @@ from ..utils import *
 from ..schemas import *
 
 
+@pytest.fixture(scope="module")
+def chs_comp() -> Event:
+    """The 2022 Chesapeake District Championship, shared by the tests requesting data about the same event."""
+    return Event("2022chcmp")
+
+
 def test_event_one_argument():
     """Tests `Event` with ensuring that an instance is instantiated properly when only the key is passed in as a positional argument."""
     with ApiClient():
@@ -26,75 +34,118 @@ def test_event_kwarg():
         assert chs_comp.key == "2022chcmp"
 
 
-def test_event_alliances():
+def test_event_from_dict():
+    """Tests `Event.from_dict` with ensuring that it creates the same event as passing the data in as keyword arguments."""
+    event_data = {
+        "key": "2022chcmp",
+        "name": "Chesapeake District Championship",
+        "start_date": "2022-04-06",
+        "end_date": "2022-04-09",
+    }
+
+    with ApiClient():
+        chs_comp = Event.from_dict(event_data)
+        assert chs_comp == Event(**event_data) and chs_comp.year == 2022 and chs_comp.event_code == "chcmp"
+
+
+def test_event_lazy_attributes():
+    """Tests that an event's district and dates, which are only built once they're accessed, are part of its items and representation."""  # noqa
+    event_data = {
+        "key": "2022chcmp",
+        "district": {"key": "2022chs", "year": 2022, "abbreviation": "chs", "display_name": "FIRST Chesapeake"},
+        "start_date": "2022-04-06",
+    }
+
+    with ApiClient():
+        chs_comp = Event.from_dict(event_data)
+        assert "district=District(...)" in repr(chs_comp) and "start_date=datetime.datetime(2022, 4, 6, 0, 0)" in repr(
+            chs_comp
+        )
+        assert chs_comp["district"].key == "2022chs" and chs_comp["start_date"] == datetime.datetime(2022, 4, 6)
+
+
+def test_event_alliances(chs_comp: Event):
     """Tests TBA's endpoint that retrieves all alliances in an event."""
     with ApiClient():
-        chs_comp_alliances = Event("2022chcmp").alliances()
+        chs_comp_alliances = chs_comp.alliances()
         assert isinstance(chs_comp_alliances, list) and all(
             isinstance(alliance, Event.Alliance) for alliance in chs_comp_alliances
         )
 
 
-def test_event_awards():
+def test_event_awards(chs_comp: Event):
     """Tests TBA's endpoint that retrieves all awards distributed at an event."""
     with ApiClient():
-        chs_comp_awards = Event("2022chcmp").awards()
+        chs_comp_awards = chs_comp.awards()
         assert isinstance(chs_comp_awards, list) and all(
             isinstance(comp_award, Award) for comp_award in chs_comp_awards
         )
 
 
-def test_event_district_points():
+def test_event_district_points(chs_comp: Event):
     """Tests TBA's endpoint that retrieves the district points distributed to all teams at that event."""
     with ApiClient():
-        event_district_points = Event("2022chcmp").district_points()
+        event_district_points = chs_comp.district_points()
         assert isinstance(event_district_points, Event.DistrictPoints)
 
 
-def test_event_insights():
+def test_event_insights(chs_comp: Event):
     """Tests TBA's endpoint that retrieves insights about an event."""
     with ApiClient():
-        chs_comp_insights = Event("2022chcmp").insights()
+        chs_comp_insights = chs_comp.insights()
         assert isinstance(chs_comp_insights, Event.Insights)
 
 
-def test_event_matches():
-    """Tests TBA's endpoint to retrieve all matches that occurred at an event."""
+@pytest.mark.parametrize("kwargs,expected_type", (({}, Match), ({"simple": True}, Match), ({"keys": True}, str)))
+def test_event_matches(chs_comp: Event, kwargs: dict, expected_type: type):
+    """Tests TBA's endpoint to retrieve all matches (or shortened information about them or their keys) that occurred at an event."""
     with ApiClient():
-        chs_comp_matches = Event("2022chcmp").matches()
+        chs_comp_matches = chs_comp.matches(**kwargs)
         assert isinstance(chs_comp_matches, list) and all(
-            isinstance(comp_match, Match) for comp_match in chs_comp_matches
+            isinstance(comp_match, expected_type) for comp_match in chs_comp_matches
         )
 
 
-def test_event_matches_simple():
+def test_event_matches_simple(chs_comp: Event):
     """Tests TBA's endpoint to retrieve shortened information about all the matches that occurred at an event."""
     with ApiClient():
-        chs_comp_matches = Event("2022chcmp").matches()
-        chs_comp_matches_simple = Event("2022chcmp").matches(simple=True)
+        chs_comp_matches, chs_comp_matches_simple = fetch_many(
+            chs_comp.matches_async(), chs_comp.matches_async(simple=True)
+        )
         assert chs_comp_matches != chs_comp_matches_simple
 
 
-def test_event_matches_keys():
-    """Tests TBA's endpoint to retrieve the keys of all the matches that occurred at an event."""
+def test_event_matches_memoized():
+    """Tests `Event.matches` to ensure that its result is memoized until `invalidate_cache` is called."""
     with ApiClient():
-        chs_comp_matches_keys = Event("2022chcmp").matches(keys=True)
-        assert isinstance(chs_comp_matches_keys, list) and all(
-            isinstance(match_key, str) for match_key in chs_comp_matches_keys
-        )
+        chs_comp = Event("2022chcmp")
+        chs_comp_matches = chs_comp.matches()
+        assert chs_comp.matches() is chs_comp_matches
+
+        chs_comp.invalidate_cache()
+        assert chs_comp.matches() is not chs_comp_matches and chs_comp.matches() == chs_comp_matches
+
+
+def test_event_matches_caching_headers():
+    """Tests `Event.matches` to ensure its memoized result isn't returned when the caching headers are used."""
+    with pytest.raises(NotModifiedSinceError):
+        with ApiClient():
+            chs_comp = Event("2022chcmp")
+            for _ in range(2):
+                chs_comp.matches(keys=True, use_caching=True)
 
 
-def test_event_matches_extra_parameters():
+def test_event_matches_extra_parameters(chs_comp: Event):
     """Tests `Event.matches` to ensure that an error is raised when more than one parameter out of `simple`, `keys` and `timeseries` is True."""
     with pytest.raises(ValueError):
         with ApiClient():
-            Event("2022chcmp").matches(simple=True, keys=True, timeseries=True)
+            chs_comp.matches(simple=True, keys=True, timeseries=True)
 
 
-def test_event_oprs():
+def test_event_oprs(chs_comp: Event):
     """Tests TBA's endpoint to retrieve the OPRs, DPRs, and CCWMs of all teams at an event."""
     with ApiClient():
-        chs_comp_oprs = Event("2022chcmp").oprs()
+        chs_comp_oprs = chs_comp.oprs()
         assert (
             isinstance(chs_comp_oprs, Event.OPRs)
             and isinstance(chs_comp_oprs.oprs, dict)
@@ -103,10 +154,10 @@ def test_event_oprs():
         )
 
 
-def test_event_opr_average():
+def test_event_opr_average(chs_comp: Event):
     """Tests `Event.OPRs.average` to ensure that it returns the average of the OPRs of teams at an event."""
     with ApiClient():
-        chs_avg_oprs = Event("2022chcmp").oprs().average()
+        chs_avg_oprs = chs_comp.oprs().average()
         assert (
             isinstance(chs_avg_oprs, dict)
             and "opr" in chs_avg_oprs.keys()
@@ -115,64 +166,101 @@ def test_event_opr_average():
         )
 
 
-def test_event_opr_average_with_metric():
+def test_event_opr_average_with_metric(chs_comp: Event):
     """Tests `Event.OPRs.average` with the metric argument to ensure that it only returns the metric specified."""
     with ApiClient():
-        chs_avg_opr = Event("2022chcmp").oprs().average(metric="opr")
+        chs_avg_opr = chs_comp.oprs().average(metric="opr")
         assert isinstance(chs_avg_opr, float)
 
 
-def test_event_opr_average_error():
+def test_event_opr_average_error(chs_comp: Event):
     """Tests `Event.OPRs.average` with a wrong argument for the `metric` parameter to ensure it errors out."""
     with pytest.raises(ValueError):
         with ApiClient():
-            Event("2022chcmp").oprs().average(metric="wrong metric")
+            chs_comp.oprs().average(metric="wrong metric")
 
 
-def test_event_predictions():
+def test_event_opr_average_many(chs_comp: Event):
+    """Tests `Event.OPRs.average_many` to get the average of a metric across multiple events."""
+    with ApiClient():
+        chs_comp_oprs = chs_comp.oprs()
+        assert Event.OPRs.average_many([chs_comp_oprs, chs_comp_oprs], metric="opr") == pytest.approx(
+            chs_comp_oprs.average(metric="opr")
+        )
+
+
+def test_event_rankings_caching_headers():
+    """Tests `Event.rankings` to ensure its memoized result isn't returned when the caching headers are used."""
+    with pytest.raises(NotModifiedSinceError):
+        with ApiClient():
+            chs_comp = Event("2022chcmp")
+            for _ in range(2):
+                chs_comp.rankings(use_caching=True)
+
+
+def test_event_rankings_memoized():
+    """Tests `Event.rankings` to ensure its result is memoized for as long as the response it came from is cached."""
+    with ApiClient():
+        chs_comp = Event("2022chcmp")
+        assert chs_comp.rankings() is chs_comp.rankings()
+
+
+def test_event_rankings_memo_expired(monkeypatch):
+    """Tests `Event.rankings` to ensure its memoized result expires along with the response it came from."""
+    monkeypatch.setattr(InternalData, "DEFAULT_CACHE_TTL", 0)
+
+    with ApiClient():
+        chs_comp = Event("2022chcmp")
+        first_rankings = chs_comp.rankings()
+        second_rankings = chs_comp.rankings()
+        assert first_rankings is not second_rankings and first_rankings == second_rankings
+
+
+def test_event_predictions(chs_comp: Event):
     """Tests TBA's endpoint to retrieve the predictions for the matches at an event."""
     with ApiClient():
-        chs_comp_predictions = Event("2022chcmp").predictions()
+        chs_comp_predictions = chs_comp.predictions()
         assert isinstance(chs_comp_predictions, dict)
 
 
-def test_event_rankings():
+def test_event_rankings(chs_comp: Event):
     """Tests TBA's endpoint to retrieve the rankings of all teams at an event."""
     with ApiClient():
-        chs_comp_rankings = Event("2022chcmp").rankings()
+        chs_comp_rankings = chs_comp.rankings()
         assert all(isinstance(team_key, str) for team_key in chs_comp_rankings.keys()) and all(
             isinstance(team_ranking, Event.Ranking) for team_ranking in chs_comp_rankings.values()
         )
 
 
-def test_event_teams():
-    """Tests TBA's endpoint to retrieve all the teams that played at an event."""
+def test_event_fetch_many():
+    """Tests retrieving data from multiple of TBA's endpoints about an event concurrently with `fetch_many`."""
     with ApiClient():
-        chs_comp_teams = Event("2022chcmp").teams()
-        assert isinstance(chs_comp_teams, list) and all(isinstance(comp_team, Team) for comp_team in chs_comp_teams)
+        chs_comp = Event("2022chcmp")
+        chs_comp_rankings, chs_comp_teams = fetch_many(chs_comp.rankings_async(), chs_comp.teams_async(keys=True))
+        assert chs_comp_rankings == chs_comp.rankings() and chs_comp_teams == chs_comp.teams(keys=True)
 
 
-def test_event_teams_simple():
-    """Tests TBA's endpoint to retrieve shortened information about all the teams that played at an event."""
+@pytest.mark.parametrize("kwargs,expected_type", (({}, Team), ({"simple": True}, Team), ({"keys": True}, str)))
+def test_event_teams(chs_comp: Event, kwargs: dict, expected_type: type):
+    """Tests TBA's endpoint to retrieve all the teams (or shortened information about them or their keys) that played at an event."""
     with ApiClient():
-        chs_comp_teams = Event("2022chcmp").teams()
-        chs_comp_teams_simple = Event("2022chcmp").teams(simple=True)
-        assert chs_comp_teams != chs_comp_teams_simple
+        chs_comp_teams = chs_comp.teams(**kwargs)
+        assert isinstance(chs_comp_teams, list) and all(
+            isinstance(comp_team, expected_type) for comp_team in chs_comp_teams
+        )
 
 
-def test_event_teams_keys():
-    """Tests TBA's endpoint to retrieve the keys of all the teams that played at an event.."""
+def test_event_teams_simple(chs_comp: Event):
+    """Tests TBA's endpoint to retrieve shortened information about all the teams that played at an event."""
     with ApiClient():
-        chs_comp_teams_keys = Event("2022chcmp").teams(keys=True)
-        assert isinstance(chs_comp_teams_keys, list) and all(
-            isinstance(team_key, str) for team_key in chs_comp_teams_keys
-        )
+        chs_comp_teams, chs_comp_teams_simple = fetch_many(chs_comp.teams_async(), chs_comp.teams_async(simple=True))
+        assert chs_comp_teams != chs_comp_teams_simple
 
 
-def test_event_teams_statuses():
+def test_event_teams_statuses(chs_comp: Event):
     """Tests TBA's endpoint to retrieve the statuses of all the teams that played/are playing at an event.."""
     with ApiClient():
-        chs_comp_teams_statuses = Event("2022chcmp").teams(statuses=True)
+        chs_comp_teams_statuses = chs_comp.teams(statuses=True)
         assert (
             isinstance(chs_comp_teams_statuses, dict)
             and all(isinstance(team_key, str) for team_key in chs_comp_teams_statuses.keys())
@@ -180,106 +268,130 @@ def test_event_teams_statuses():
         )
 
 
-def test_event_teams_extra_parameters():
+def test_event_teams_extra_parameters(chs_comp: Event):
     """Tests `Event.teams` to ensure that an error is raised when more than one parameter out of `simple`, `keys` and `statuses` is True."""
     with pytest.raises(ValueError):
         with ApiClient():
-            Event("2022chcmp").teams(simple=True, keys=True, statuses=True)
+            chs_comp.teams(simple=True, keys=True, statuses=True)
 
 
-def test_event_min_match_score():
+def test_event_min_match_score(chs_comp: Event):
     """Tests `Event.min` to retrieve the minimum match score during an event."""
     with ApiClient():
-        minimum_match_score = Event("2022chcmp").min(metric=Metrics.MATCH_SCORE)
+        minimum_match_score = chs_comp.min(metric=Metrics.MATCH_SCORE)
         assert isinstance(minimum_match_score, Match)
 
 
-def test_team_min_opr():
+def test_team_min_opr(chs_comp: Event):
     """Tests `Event.min` to retrieve the minimum OPR/DPR/CCWM during an event."""
     with ApiClient():
-        minimum_opr, team = Event("2022chcmp").min(metric=Metrics.OPR)
+        minimum_opr, team = chs_comp.min(metric=Metrics.OPR)
         assert isinstance(minimum_opr, float) and isinstance(team, Team)
 
 
-def test_event_max_match_score():
+def test_event_max_match_score(chs_comp: Event):
     """Tests `Event.max` to retrieve the maximum match score during an event."""
     with ApiClient():
-        maximum_match_score = Event("2022chcmp").max(metric=Metrics.MATCH_SCORE)
+        maximum_match_score = chs_comp.max(metric=Metrics.MATCH_SCORE)
         assert isinstance(maximum_match_score, Match)
 
 
-def test_event_max_opr():
+def test_event_max_opr(chs_comp: Event):
     """Tests `Event.max` to retrieve the maximum OPR/DPR/CCWM during an event."""
     with ApiClient():
-        maximum_opr, team = Event("2022chcmp").max(metric=Metrics.OPR)
+        maximum_opr, team = chs_comp.max(metric=Metrics.OPR)
         assert isinstance(maximum_opr, float) and isinstance(team, Team)
 
 
-def test_event_average_match_score():
+def test_event_average_match_score(chs_comp: Event):
     """Tests `Event.average` to retrieve the average match score during an event."""
     with ApiClient():
-        average_match_score = Event("2022chcmp").average(metric=Metrics.MATCH_SCORE)
+        average_match_score = chs_comp.average(metric=Metrics.MATCH_SCORE)
         assert isinstance(average_match_score, float)
 
 
-def test_event_average_opr():
+def test_event_average_opr(chs_comp: Event):
     """Tests `Event.average` to retrieve the average OPR during an event."""
     with ApiClient():
-        average_opr = Event("2022chcmp").average(metric=Metrics.OPR)
+        average_opr = chs_comp.average(metric=Metrics.OPR)
         assert isinstance(average_opr, float)
 
 
-def test_update_event_info():
+def test_update_event_info(chs_comp: Event, rejected_writes: None):
     """Mock test for `Event.update_info` which passes in data and expects back an error about a wrong key."""
     with pytest.raises(TBAError, match="X-TBA-Auth-Sig"):
         with ApiClient(auth_secret="NOT A REAL AUTH SECRET"):
-            Event("2022chcmp").update_info({"fake": "data"})
+            chs_comp.update_info({"fake": "data"})
 
 
-def test_update_alliance_selections():
+def test_update_alliance_selections(chs_comp: Event, rejected_writes: None):
     """Mock test for `Event.update_alliance_selections` which passes in data and expects back an error about a wrong key."""  # noqa
     with pytest.raises(TBAError, match="X-TBA-Auth-Sig"):
         with ApiClient(auth_secret="NOT A REAL AUTH SECRET"):
-            Event("2022chcmp").update_alliance_selections([["not a real team", "frc120000"], ["foo bar"]])
+            chs_comp.update_alliance_selections([["not a real team", "frc120000"], ["foo bar"]])
 
 
-def test_update_awards():
+def test_update_awards(chs_comp: Event, rejected_writes: None):
     """Mock test for `Event.update_awards` which passes in data and expects back an error about a wrong key."""
     with pytest.raises(TBAError, match="X-TBA-Auth-Sig"):
         with ApiClient(auth_secret="NOT A REAL AUTH SECRET"):
-            Event("2022chcmp").update_awards([{"fake": "award"}])
+            chs_comp.update_awards([{"fake": "award"}])
 
 
-def test_update_matches():
+def test_update_matches(chs_comp: Event, rejected_writes: None):
     """Mock test for `Event.update_matches` which passes in data and expects back an error about a wrong key."""
     with pytest.raises(TBAError, match="X-TBA-Auth-Sig"):
         with ApiClient(auth_secret="NOT A REAL AUTH SECRET"):
-            Event("2022chcmp").update_matches([{"qm1000": "match"}])
+            chs_comp.update_matches([{"qm1000": "match"}])
 
 
-def test_delete_matches():
+def test_delete_matches(chs_comp: Event, rejected_writes: None):
     """Mock test for `Event.delete_matches` which passes in data and expects back an error about a wrong key."""
     with pytest.raises(TBAError, match="X-TBA-Auth-Sig"):
         with ApiClient(auth_secret="NOT A REAL AUTH SECRET"):
-            Event("2022chcmp").delete_matches(["qm100"])
+            chs_comp.delete_matches(["qm100"])
 
 
-def test_update_team_list():
+def test_update_team_list(chs_comp: Event, rejected_writes: None):
     """Mock test for `Event.update_team_list` which passes in data and expects back an error about a wrong key."""
     with pytest.raises(TBAError, match="X-TBA-Auth-Sig"):
         with ApiClient(auth_secret="NOT A REAL AUTH SECRET"):
-            Event("2022chcmp").update_team_list(["frc1000000", "frc0"])
+            chs_comp.update_team_list(["frc1000000", "frc0"])
 
 
-def test_update_match_videos():
+def test_update_match_videos(chs_comp: Event, rejected_writes: None):
     """Mock test for `Event.update_match_videos` which passes in data and expects back an error about a wrong key."""
     with pytest.raises(TBAError, match="X-TBA-Auth-Sig"):
         with ApiClient(auth_secret="NOT A REAL AUTH SECRET"):
-            Event("2022chcmp").update_match_videos({"qm0": "yt-link"})
+            chs_comp.update_match_videos({"qm0": "yt-link"})
 
 
-def test_update_media():
+def test_update_media(chs_comp: Event, rejected_writes: None):
     """Mock test for `Event.update_media` which passes in data and expects back an error about a wrong key."""
     with pytest.raises(TBAError, match="X-TBA-Auth-Sig"):
         with ApiClient(auth_secret="NOT A REAL AUTH SECRET"):
-            Event("2022chcmp").update_media(["yt-video-1"])
+            chs_comp.update_media(["yt-video-1"])
+
+
+def test_update_clears_cache(monkeypatch, sent_requests: list, empty_cache: None):
+    """Tests that updating an event requests its and its matches' data again afterwards, but not other events' matches."""
+
+    async def accept_post(*args, **kwargs) -> None:
+        pass
+
+    def request_data(api_client: ApiClient) -> None:
+        Event("2022chcmp").teams(keys=True)
+        api_client.match("2022chcmp_qm1")
+        api_client.match("2022va_qm1")
+
+    monkeypatch.setattr(InternalData, "post", accept_post)
+
+    with ApiClient(auth_secret="NOT A REAL AUTH SECRET") as api_client:
+        request_data(api_client)
+        Event("2022chcmp").update_matches([{"qm1": "match"}])
+        request_data(api_client)
+
+    requested_urls = [url for url, _ in sent_requests]
+    assert requested_urls.count(construct_url("event", key="2022chcmp") + "/teams/keys") == 2
+    assert requested_urls.count(construct_url("match", key="2022chcmp_qm1")) == 2
+    assert requested_urls.count(construct_url("match", key="2022va_qm1")) == 1
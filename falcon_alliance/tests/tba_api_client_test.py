@@ -1,6 +1,12 @@
+import asyncio
+import contextlib
+import datetime
+import typing
+
 import pytest
 
 from ..api_client import ApiClient
+from .conftest import RecordedResponse
 from ..utils import *
 from ..schemas import *
 
@@ -41,6 +47,156 @@ def test_dictionary_syntax():
         assert team4099["team_number"] == 4099
 
 
+def test_disk_cache(tmp_path, monkeypatch, empty_cache):
+    """Tests that responses are saved to the disk cache and served from it once the in-memory cache is cleared."""
+    monkeypatch.setattr(InternalData, "disk_cache_dir", None)
+
+    with ApiClient(cache_dir=str(tmp_path)) as api_client:
+        team4099 = api_client.team("frc4099")
+        InternalData.clear_cache()
+        assert any(tmp_path.iterdir()) and api_client.team("frc4099") == team4099
+
+    assert InternalData.disk_cache_dir is None
+
+
+def _requests_to(sent_requests: typing.List[typing.Tuple[str, dict]], url_suffix: str) -> typing.List[dict]:
+    """Retrieves the headers of each GET request sent to the URL ending with the suffix passed in."""
+    return [headers for url, headers in sent_requests if url.endswith(url_suffix)]
+
+
+def test_response_cache_hit(sent_requests, empty_cache):
+    """Tests that a response is served from memory within its time to live instead of being requested again."""
+    with ApiClient() as api_client:
+        assert api_client.team("frc4099") == api_client.team("frc4099")
+
+    assert len(_requests_to(sent_requests, "/team/frc4099")) == 1
+
+
+def test_response_cache_revalidated(monkeypatch, sent_requests, empty_cache):
+    """Tests that an expired response is revalidated with its ETag and served again when it hasn't changed."""
+    monkeypatch.setattr(InternalData, "DEFAULT_CACHE_TTL", 0)
+
+    with ApiClient() as api_client:
+        assert api_client.team("frc4099") == api_client.team("frc4099")
+
+    first_request, second_request = _requests_to(sent_requests, "/team/frc4099")
+    assert "If-None-Match" not in first_request and second_request["If-None-Match"]
+
+
+class _FakeSession:
+    """Session answering GETs with the responses given in turn (repeating the last one), counting the requests sent."""
+
+    def __init__(self, *responses: RecordedResponse):
+        self.responses = responses
+        self.requests_sent = 0
+
+    @contextlib.asynccontextmanager
+    async def get(self, url: str, **kwargs) -> typing.AsyncIterator[RecordedResponse]:
+        response = self.responses[min(self.requests_sent, len(self.responses) - 1)]
+        self.requests_sent += 1
+        # Gives the other coroutines a chance to send their requests before this one responds.
+        await asyncio.sleep(0)
+        yield response
+
+
+def _gather_gets(url: str, count: int) -> list:
+    """Sends `count` identical GET requests to the URL concurrently, returning their results (or the errors raised)."""
+    requests = [
+        InternalData.get(current_instance=Team(4099), url=url, headers={"X-TBA-Auth-Key": "key"}) for _ in range(count)
+    ]
+    return InternalData.loop.run_until_complete(asyncio.gather(*requests, return_exceptions=True))
+
+
+def test_response_cache_replaced(monkeypatch, empty_cache):
+    """Tests that an expired response is replaced when TBA responds with a newer version of it."""
+    monkeypatch.setattr(InternalData, "DEFAULT_CACHE_TTL", 0)
+    session = _FakeSession(RecordedResponse(200, "1", '{"version": 1}'), RecordedResponse(200, "2", '{"version": 2}'))
+
+    with ApiClient():
+        monkeypatch.setattr(InternalData, "session", session)
+        (first_response,) = _gather_gets("https://www.thebluealliance.com/api/v3/replaced", 1)
+        (second_response,) = _gather_gets("https://www.thebluealliance.com/api/v3/replaced", 1)
+
+    assert first_response == {"version": 1} and second_response == {"version": 2}
+
+
+def test_response_cache_isolated(empty_cache):
+    """Tests that changing the data given by a call doesn't change the data later calls are given from memory."""
+    with ApiClient() as api_client:
+        api_client.events(year=2022, keys=True).append("2022fake")
+        assert "2022fake" not in api_client.events(year=2022, keys=True)
+
+
+def test_response_cache_bounded(monkeypatch, sent_requests, empty_cache):
+    """Tests that the least recently used responses are evicted once `MAX_CACHED_RESPONSES` responses are cached."""
+    monkeypatch.setattr(InternalData, "MAX_CACHED_RESPONSES", 1)
+
+    with ApiClient() as api_client:
+        api_client.team("frc4099")
+        api_client.team("frc4099")
+        api_client.event("2022chcmp")
+        api_client.team("frc4099")
+
+    # Served from memory the second time, but requested again once the event's response evicted it.
+    assert len(_requests_to(sent_requests, "/team/frc4099")) == 2
+
+
+def test_clear_cache_url_segment(sent_requests, empty_cache):
+    """Tests `InternalData.clear_cache` to ensure only the responses from URLs containing the segment passed in are cleared."""
+    with ApiClient() as api_client:
+        for _ in range(2):
+            api_client.team("frc4099")
+            api_client.event("2022chcmp")
+            InternalData.clear_cache("/event/2022chcmp")
+
+    assert len(_requests_to(sent_requests, "/team/frc4099")) == 1
+    assert len(_requests_to(sent_requests, "/event/2022chcmp")) == 2
+
+
+def test_cache_ttl_path_segments():
+    """Tests `InternalData.cache_ttl` to ensure the time to live of a response depends on the segments of its URL's path."""  # noqa
+    assert InternalData.cache_ttl(construct_url("team", key="frc4099") + "/events/2022") == 300
+    assert InternalData.cache_ttl(construct_url("event", key="2022chcmp") + "/matches") == 60
+    assert (
+        InternalData.cache_ttl(construct_url("district", key="2022events") + "/teams") == InternalData.DEFAULT_CACHE_TTL
+    )
+
+
+def test_concurrent_requests_coalesced(monkeypatch, empty_cache):
+    """Tests that identical GET requests sent concurrently share a single request to TBA."""
+    session = _FakeSession(RecordedResponse(200, "", '{"key": "frc4099"}'))
+
+    with ApiClient():
+        monkeypatch.setattr(InternalData, "session", session)
+        responses = _gather_gets("https://www.thebluealliance.com/api/v3/coalesced", 2)
+
+    assert session.requests_sent == 1 and responses == [{"key": "frc4099"}, {"key": "frc4099"}]
+
+
+def test_concurrent_requests_coalesced_error(monkeypatch, empty_cache):
+    """Tests that a TBAError raised by a request shared between identical GET requests reaches every one of them."""
+    session = _FakeSession(RecordedResponse(404, "", '{"Error": "frc0 is not a valid team key"}'))
+
+    with ApiClient():
+        monkeypatch.setattr(InternalData, "session", session)
+        responses = _gather_gets("https://www.thebluealliance.com/api/v3/coalesced_error", 2)
+
+    assert session.requests_sent == 1 and all(
+        isinstance(response, TBAError) and "frc0 is not a valid team key" in str(response) for response in responses
+    )
+
+
+def test_error_not_json(monkeypatch, empty_cache):
+    """Tests that an error response that isn't JSON (eg an HTML page from TBA's CDN) raises a TBAError with its status."""
+    with ApiClient():
+        monkeypatch.setattr(
+            InternalData, "session", _FakeSession(RecordedResponse(503, "", "<html>Unavailable</html>"))
+        )
+        (error,) = _gather_gets("https://www.thebluealliance.com/api/v3/not_json", 1)
+
+    assert isinstance(error, TBAError) and str(error) == "503 Service Unavailable"
+
+
 def test_team_not_existing():
     """Tests `ApiClient.team` to ensure that it raises an error when you pass in an invalid team key."""
     with pytest.raises(TBAError, match="is not a valid team key"):
@@ -121,6 +277,21 @@ def test_match_simple():
         assert einstein_final != einstein_final_simple
 
 
+def test_match_lazy_attributes():
+    """Tests that a match's times, which are only converted into datetimes once they're accessed, are part of its items and representation."""  # noqa
+    with ApiClient():
+        alliance_data = {"score": 0, "team_keys": [], "surrogate_team_keys": [], "dq_team_keys": []}
+        einstein_final = Match.from_dict(
+            {
+                "key": "2022cmptx_f1m1",
+                "alliances": {"red": alliance_data, "blue": alliance_data},
+                "actual_time": 1650829587,
+            }
+        )
+        assert "actual_time=datetime.datetime(" in repr(einstein_final)
+        assert einstein_final["actual_time"] == datetime.datetime.fromtimestamp(1650829587)
+
+
 def test_match_timeseries():
     """Tests `TBAError` being raised for timeseries data regarding an invalid endpoint since timeseries data isn't implemented yet for many matches."""
     with pytest.raises(TBAError, match="Invalid endpoint"):
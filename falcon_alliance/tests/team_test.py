@@ -42,6 +42,23 @@ def test_team_kwarg():
         assert team4099.key == "frc4099" and team4099.team_number == 4099
 
 
+@pytest.mark.parametrize("args", [("frc", "4099"), (4099, 4099), ("frc", 4099, "frc")])
+def test_team_invalid_arguments(args: tuple):
+    """Tests that initializing `Team` with positional arguments that aren't a team number and 'frc' raises an error."""
+    with ApiClient():
+        with pytest.raises(TypeError):
+            Team(*args)
+
+
+def test_team_from_dict():
+    """Tests `Team.from_dict` with ensuring that it creates the same team as passing the data in as keyword arguments."""
+    team_data = {"key": "frc4099", "team_number": 4099, "nickname": "The Falcons", "rookie_year": 2012}
+
+    with ApiClient():
+        team4099 = Team.from_dict(team_data)
+        assert team4099 == Team(**team_data) and team4099.team_number == 4099 and team4099.nickname == "The Falcons"
+
+
 def test_team_awards():
     """Tests TBA's endpoint to retrieve all awards a team has gotten over its career."""
     with ApiClient():
@@ -121,6 +138,15 @@ def test_team_matches_event_code_keys():
         )
 
 
+def test_team_matches_partial_event_code():
+    """Tests `Team.matches` to ensure an event code only matches the events whose code starts with it."""
+    with ApiClient():
+        team4099 = Team(4099)
+        team4099_iri_matches = team4099.matches(2022, "iri", keys=True)
+        assert team4099.matches(2022, "ir", keys=True) == team4099_iri_matches
+        assert team4099.matches(2022, "ri", keys=True) == []
+
+
 def test_team_matches_simple():
     """Tests TBA's endpoint to retrieve shortened information about all the matches a team played in a certain year."""
     with ApiClient():
@@ -175,6 +201,12 @@ def test_team_robots():
         )
 
 
+def test_robot_from_dict():
+    """Tests `Robot.from_dict` with ensuring that the default of setting an attribute for each item creates the same robot as passing the data in as keyword arguments."""  # noqa
+    robot_data = {"year": 2022, "robot_name": "Rapid React Robot", "key": "frc4099_2022", "team_key": "frc4099"}
+    assert Robot.from_dict(robot_data) == Robot(**robot_data)
+
+
 def test_team_events():
     """Tests TBA's endpoint to retrieve all events a team has ever played at."""
     with ApiClient():
@@ -228,6 +260,7 @@ def test_team_events_statuses():
         (None, False, True, True, "statuses cannot be True in conjunction with simple or keys"),
         (None, False, False, True, "statuses cannot be True if a year isn't passed into Team.events."),
         (range(2020, 2023), False, False, True, "statuses cannot be True when year is a range object."),
+        (2022, 1, 1, None, "simple and keys cannot both be True"),
     ),
 )
 def test_team_events_errors(
@@ -287,6 +320,7 @@ def test_team_event_status():
         (False, True, True, True, False, "simple and keys cannot both be True"),
         (True, True, False, False, False, "awards cannot be True in conjunction with simple, keys or matches"),
         (False, True, False, False, True, "status cannot be True in conjunction with simple, keys or matches"),
+        (None, 1, 1, 1, 0, "simple and keys cannot both be True"),
     ),
 )
 def test_team_event_errors(awards: bool, matches: bool, simple: bool, keys: bool, status: bool, match: str):
@@ -305,6 +339,14 @@ def test_team_social_media():
         )
 
 
+def test_team_social_media_async():
+    """Tests `Team.social_media_async` with ensuring that it retrieves the same accounts as `Team.social_media`."""
+    with ApiClient():
+        team4099 = Team(4099)
+        team4099_social_media = InternalData.loop.run_until_complete(team4099.social_media_async())
+        assert team4099_social_media == team4099.social_media()
+
+
 def test_team_min_match_score():
     """Tests `Team.min` to retrieve the minimum match score."""
     with ApiClient():
@@ -312,6 +354,17 @@ def test_team_min_match_score():
         assert isinstance(minimum_match_score, Match) and minimum_match_score.match_number == 29
 
 
+def test_team_min_match_score_single_request(sent_requests, empty_cache):
+    """Tests that `Team.min` retrieves the matches it picks from in a single request, reusing them when it's called again."""  # noqa
+    with ApiClient():
+        team4099 = Team(4099)
+        assert team4099.min(2022, metric=Metrics.MATCH_SCORE) is team4099.min(2022, metric=Metrics.MATCH_SCORE)
+
+    assert [url for url, _ in sent_requests if "/match" in url] == [
+        construct_url("team", key="frc4099") + "/matches/2022"
+    ]
+
+
 def test_team_min_oprs():
     """Tests `Team.min` to retrieve the minimum OPR/DPR/CCWM."""
     with ApiClient():
@@ -335,6 +388,23 @@ def test_team_max_oprs():
         assert isinstance(maximum_opr, float) and isinstance(event_with_opr, Event)
 
 
+def test_team_top_k_oprs():
+    """Tests `Team.top_k` to retrieve the highest OPRs/DPRs/CCWMs, starting with the maximum."""
+    with ApiClient():
+        team4099 = Team(4099)
+        top_oprs = team4099.top_k(2022, metric=Metrics.OPR, k=2)
+        assert len(top_oprs) <= 2 and top_oprs[0] == team4099.max(2022, metric=Metrics.OPR)
+
+
+def test_team_top_k_match_scores():
+    """Tests `Team.top_k` to retrieve the matches with the highest scores, starting with the maximum."""
+    with ApiClient():
+        team4099 = Team(4099)
+        top_matches = team4099.top_k(2022, metric=Metrics.MATCH_SCORE, k=3)
+        assert len(top_matches) <= 3 and all(isinstance(top_match, Match) for top_match in top_matches)
+        assert top_matches[0] == team4099.max(2022, metric=Metrics.MATCH_SCORE)
+
+
 def test_team_average_match_score():
     """Tests `Team.average` to retrieve average match score for a team."""
     with ApiClient():
@@ -2,4 +2,4 @@ from .exceptions import *
 from .functions import *
 from .internal_data import InternalData
 
-__all__ = ["construct_url", "to_team_key", "Metrics", "InternalData", "NotModifiedSinceError", "TBAError"]
+__all__ = ["construct_url", "fetch_many", "to_team_key", "Metrics", "InternalData", "NotModifiedSinceError", "TBAError"]
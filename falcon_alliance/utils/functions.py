@@ -1,7 +1,15 @@
+import asyncio
+import functools
 import typing
 from enum import Enum
 
-__all__ = ["construct_url", "Metrics", "to_team_key"]
+from falcon_alliance.utils.exceptions import NotModifiedSinceError
+from falcon_alliance.utils.internal_data import InternalData
+
+__all__ = ["construct_url", "fetch_many", "Metrics", "to_team_key"]
+
+_SNAKE_CASE_TRANSLATION = str.maketrans({" ": "_"})
+_Function = typing.TypeVar("_Function", bound=typing.Callable[..., typing.Any])
 
 
 class Metrics(Enum):
@@ -11,26 +19,39 @@ class Metrics(Enum):
     CCWM = 4
 
 
+@functools.lru_cache(maxsize=2048)
 def construct_url(base_endpoint, **kwargs) -> str:
     """
     Constructs a URL to send a request to with the given parameters.
 
+    The same URLs are constructed whenever an endpoint is requested again, so the results are memoized (all parameters must be hashable).
+
     Parameters:
         endpoint: The base endpoint to add all the different additions to the URL.
         kwargs: Arbritary amount of keyword arguments to construct the URL.
 
     Returns:
         A string of the constructed URL based on the endpoints.
+    """  # noqa
+    return f"https://www.thebluealliance.com/api/v3/{base_endpoint}/" + url_suffix(**kwargs)[1:]
+
+
+def url_suffix(**kwargs) -> str:
     """
-    return f"https://www.thebluealliance.com/api/v3/{base_endpoint}/" + "/".join(
-        map(
-            str,
-            [
-                param_name if isinstance(param_value, bool) else param_value
-                for param_name, param_value in kwargs.items()
-                if param_value is not None and param_value is not False
-            ],
-        )
+    Constructs the trailing segments of a URL from the given parameters, to be appended onto an already constructed URL.
+
+    Booleans add the name of the parameter as a segment when they are True, and parameters that are None or False are skipped entirely.
+
+    Parameters:
+        kwargs: Arbritary amount of keyword arguments to construct the segments from.
+
+    Returns:
+        A string containing each segment prefixed by a slash (eg "/2022/simple"), or an empty string if no segments were added.
+    """  # noqa
+    return "".join(
+        f"/{param_name if isinstance(param_value, bool) else param_value}"
+        for param_name, param_value in kwargs.items()
+        if param_value is not None and param_value is not False
     )
 
 
@@ -47,3 +68,94 @@ def to_team_key(team_number_or_key: typing.Union[int, str, "Team"]) -> str:  # n
         return team_number_or_key
     else:  # pragma: no cover
         return team_number_or_key.key
+
+
+def fetch_many(*coroutines: typing.Awaitable) -> list:
+    """
+    Runs the coroutines given concurrently, so that the requests they send to TBA overlap instead of being sent one after another.
+
+    This is how the `_async` versions of methods must be run, since the session they send requests with is bound to `InternalData.loop` and can't be used from another event loop (eg by awaiting them inside `asyncio.run`).
+
+    Args:
+        coroutines (typing.Awaitable): Coroutines to run, such as the ones returned by the `_async` versions of methods (eg `District.events_async()`).
+
+    Returns:
+        list: A list containing the result of each coroutine in the same order as the coroutines were given.
+    """  # noqa
+    return InternalData.loop.run_until_complete(asyncio.gather(*coroutines))
+
+
+@functools.lru_cache(maxsize=256)
+def to_snake_case(name: str) -> str:
+    """
+    Converts the name of a ranking statistic from TBA (eg "Ranking Score" or "Auto+Teleop Points") into snake case.
+
+    The same handful of names are converted for every team during an event, so the results are memoized.
+
+    Args:
+        name (str): The name of the statistic as given by TBA.
+
+    Returns:
+        str: The name of the statistic in snake case (eg "ranking_score" or "autoplusteleop_points").
+    """  # noqa
+    return name.translate(_SNAKE_CASE_TRANSLATION).lower().replace("+", "plus")
+
+
+def caching_headers(func: _Function) -> _Function:
+    """
+    Decorator for utilizing the `Etag` and `If-None-Match` caching headers for the TBA API.
+
+    The decorated method accepts the keyword arguments `use_caching`, `etag` and `silent` on top of its own. Coroutine functions are wrapped with a coroutine function so that errors raised while awaiting them are handled as well.
+
+    Args:
+        func: The method (or coroutine method) sending requests to the TBA API to decorate.
+
+    Returns:
+        The decorated method, with the same signature as far as type checkers and autocomplete are concerned.
+    """  # noqa
+    return_type = str(func.__annotations__["return"]).lower()
+    empty_type = list if "list" in return_type else dict if "dict" in return_type else None
+
+    def set_headers(self: typing.Any, use_caching: bool, etag: str, silent: bool) -> None:
+        """Stores the caching options on the instance for `InternalData.get` to use."""
+        self.use_caching = use_caching
+        self.silent = silent
+
+        if etag:
+            self.etag = etag
+
+    if asyncio.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(
+            self, *args, use_caching: bool = False, etag: str = "", silent: bool = False, **kwargs
+        ) -> typing.Any:
+            """Wrapper for adding headers to cache the results from the TBA API."""
+            set_headers(self, use_caching, etag, silent)
+
+            try:
+                return await func(self, *args, **kwargs)
+            except NotModifiedSinceError:  # pragma: no cover
+                if not silent:
+                    raise
+                elif empty_type is not None:
+                    return empty_type()
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(
+            self, *args, use_caching: bool = False, etag: str = "", silent: bool = False, **kwargs
+        ) -> typing.Any:
+            """Wrapper for adding headers to cache the results from the TBA API."""
+            set_headers(self, use_caching, etag, silent)
+
+            try:
+                return func(self, *args, **kwargs)
+            except NotModifiedSinceError:  # pragma: no cover
+                if not silent:
+                    raise
+                elif empty_type is not None:
+                    return empty_type()
+
+    return wrapper
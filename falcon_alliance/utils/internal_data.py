@@ -1,18 +1,59 @@
 import asyncio
+import collections
 import hashlib
+import pathlib
+import time
 import typing
+from json import dumps as json_dumps
+from urllib.parse import urlsplit
 
 import aiohttp
 
-from falcon_alliance.utils.exceptions import TBAError
+from falcon_alliance.utils.exceptions import NotModifiedSinceError, TBAError
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
 
 
 class InternalData:
     """Contains internal attributes such as the event loop and the client session."""
 
-    loop = asyncio.get_event_loop()
+    # uvloop's event loop schedules the requests with less overhead, but the global event loop policy is left alone.
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.get_event_loop()
     session = None
 
+    # Maximum number of simultaneous connections the session opens, so concurrent requests don't exhaust sockets.
+    CONNECTION_LIMIT = 100
+    # Seconds that TBA's DNS lookups are cached and that idle connections are kept open to be reused.
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 75
+    # Maximum number of requests in flight at once, so large gathers stay under TBA's rate limit instead of retrying.
+    MAX_CONCURRENT_REQUESTS = 16
+    _request_semaphore: typing.Optional[asyncio.Semaphore] = None
+    # Requests currently being sent, keyed like the response cache, so identical concurrent requests share one response.
+    _inflight_requests: typing.Dict[typing.Tuple[str, str], asyncio.Future] = {}
+
+    # Only responses from TBA's API are cached, other APIs (eg Nominatim for `Team.location`) have their own policies.
+    CACHED_URL_PREFIX = "https://www.thebluealliance.com/api/v3/"
+    # Seconds that responses from endpoints with each segment in their path are served from memory before revalidation.
+    CACHE_TTLS = (("matches", 60), ("social_media", 3600), ("events", 300), ("awards", 300))
+    DEFAULT_CACHE_TTL = 60
+    # Maximum number of responses kept in memory, the least recently used ones are evicted first.
+    MAX_CACHED_RESPONSES = 1024
+    # Maps (URL, API key) to (expiry, ETag, body), the body is kept undecoded so every caller gets its own objects.
+    _response_cache: "collections.OrderedDict[typing.Tuple[str, str], typing.Tuple[float, str, bytes]]" = (
+        collections.OrderedDict()
+    )
+    # Directory responses are also saved to so they can be revalidated across runs, None unless enabled.
+    disk_cache_dir: typing.Optional[pathlib.Path] = None
+
     @classmethod
     async def get(
         cls, *, current_instance: typing.Any, url: str, headers: dict, ssl: bool = True
@@ -20,6 +61,11 @@ class InternalData:
         """
         Sends a GET request to the TBA API.
 
+        Responses from TBA's API are cached in memory per API key for a time depending on the endpoint (see `CACHE_TTLS`), after which they're revalidated with their ETag, while requests to other APIs are sent as is. The cache is bypassed when an ETag is passed in by the user.
+        Cached responses are decoded again for every call, so callers can't change the data other callers are given.
+        If the disk cache is enabled (see `enable_disk_cache`), responses not cached in memory are revalidated with the ETag of the response saved on disk.
+        Identical requests sent concurrently share a single request to the TBA API.
+
         Parameters:
             current_instance (typing.Any): The instance where the get method is being called from.
             url (str): A string representing which URL to send a GET request to.
@@ -28,24 +74,225 @@ class InternalData:
 
         Returns:
             An aiohttp.ClientResponse object representing the response the GET request returned.
-        """
+
+        Raises:
+            NotModifiedSinceError: If the content of the response hasn't been modified since the ETag passed in.
+        """  # noqa
+
+        if not url.startswith(cls.CACHED_URL_PREFIX):
+            async with cls.session.get(url=url, headers=headers, ssl=ssl) as response:
+                return await response.json(loads=json_loads)
+
+        # Responses are cached per API key, as what TBA responds with can depend on the key.
+        cache_key = (url, (headers or {}).get("X-TBA-Auth-Key", ""))
+
+        if current_instance.etag:
+            cached_response = None
+        else:
+            cached_response = cls._response_cache.get(cache_key)
+
+            if cached_response is None and cls.disk_cache_dir is not None:
+                cached_response = cls._read_disk_cache(cache_key)
+
+        if cached_response is not None and cached_response[0] > time.monotonic():
+            cls._response_cache.move_to_end(cache_key)
+
+            if getattr(current_instance, "use_caching", False):
+                current_instance.etag = cached_response[1]
+
+            return json_loads(cached_response[2])
 
         if current_instance.etag:
-            headers.update({"If-None-Match": current_instance.etag})
+            request = cls._request(cache_key, headers, ssl, current_instance.etag, cached_response)
+        else:
+            request = cls._inflight_requests.get(cache_key)
+
+            if request is None:
+                request = asyncio.ensure_future(
+                    cls._request(
+                        cache_key, headers, ssl, cached_response[1] if cached_response else "", cached_response
+                    )
+                )
+                cls._inflight_requests[cache_key] = request
+                request.add_done_callback(lambda _: cls._inflight_requests.pop(cache_key, None))
+
+            # Shielded so one of the coroutines sharing the request being cancelled doesn't cancel it for the others.
+            request = asyncio.shield(request)
+
+        response_etag, response_body = await request
+
+        if getattr(current_instance, "use_caching", False):
+            current_instance.etag = response_etag
+
+        return json_loads(response_body)
+
+    @classmethod
+    async def _request(
+        cls,
+        cache_key: typing.Tuple[str, str],
+        headers: dict,
+        ssl: bool,
+        etag: str,
+        cached_response: typing.Optional[typing.Tuple[float, str, bytes]],
+    ) -> typing.Tuple[str, bytes]:
+        """
+        Sends a GET request to the TBA API and caches its response.
+
+        Parameters:
+            cache_key (tuple): The URL to send a GET request to and the API key it's sent with.
+            headers (dict): A dictionary containing the API key to authorize the request.
+            ssl (bool): A boolean representing whether or not to verify the SSL certificate.
+            etag (str): The ETag to revalidate the response with, or an empty string to send an unconditional request.
+            cached_response (tuple, optional): The cached response served again if the server responds with 304.
+
+        Returns:
+            typing.Tuple[str, bytes]: The ETag of the response and its undecoded body.
+
+        Raises:
+            NotModifiedSinceError: If the content of the response hasn't been modified since the ETag passed in.
+            TBAError: If TBA responded with an error.
+        """  # noqa
+        url = cache_key[0]
+
+        # Only copied when an ETag is sent so the caching headers don't leak into the headers shared by every schema.
+        if etag:
+            headers = {**(headers or {}), "If-None-Match": etag}
+
+        # Created on first use so it's bound to the loop the requests run on.
+        if cls._request_semaphore is None:
+            cls._request_semaphore = asyncio.Semaphore(cls.MAX_CONCURRENT_REQUESTS)
+
+        async with cls._request_semaphore, cls.session.get(url=url, headers=headers, ssl=ssl) as response:
+            if response.status == 304:
+                if cached_response is None:
+                    raise NotModifiedSinceError
+
+                # The cached response is still up to date, so it's served for another TTL.
+                cls._cache_response(cache_key, *cached_response[1:])
+                return cached_response[1], cached_response[2]
+
+            response_body = await response.read()
+
+            # TBA responds to invalid requests with an error status and a JSON object describing the error, but errors
+            # from in front of TBA (eg an HTML page from its CDN or an empty rate limiting response) aren't JSON.
+            if response.status >= 400:
+                try:
+                    error = json_loads(response_body)
+                except ValueError:
+                    raise TBAError(f"{response.status} {response.reason}") from None
+
+                raise TBAError(error.get("Error") if isinstance(error, dict) else error)
+
+            etag = response.headers.get("ETag", "")
+            cls._cache_response(cache_key, etag, response_body)
+
+            if cls.disk_cache_dir is not None and etag:
+                cls._write_disk_cache(cache_key, etag, response_body)
 
-        async with cls.session.get(url=url, headers=headers, ssl=ssl) as response:
-            response_json = await response.json()
+            return etag, response_body
 
-            try:
-                if current_instance.use_caching:
-                    current_instance.etag = response.headers["ETag"]
-            except AttributeError:  # when using a method that doesn't require requesting to TBA API.
-                pass
+    @classmethod
+    def _cache_response(cls, cache_key: typing.Tuple[str, str], etag: str, response_body: bytes) -> None:
+        """
+        Caches a response in memory for its time to live, evicting the least recently used responses past `MAX_CACHED_RESPONSES`.
+
+        Parameters:
+            cache_key (tuple): The URL the response came from and the API key it was requested with.
+            etag (str): The ETag TBA sent with the response.
+            response_body (bytes): The undecoded body of the response.
+        """  # noqa
+        cls._response_cache[cache_key] = (time.monotonic() + cls.cache_ttl(cache_key[0]), etag, response_body)
+        cls._response_cache.move_to_end(cache_key)
+
+        while len(cls._response_cache) > cls.MAX_CACHED_RESPONSES:
+            cls._response_cache.popitem(last=False)
+
+    @classmethod
+    def cache_ttl(cls, url: str) -> int:
+        """
+        Retrieves how long a response from the given URL should be served from memory before being revalidated.
+
+        Parameters:
+            url (str): A string representing the URL the response came from.
+
+        Returns:
+            An integer representing the time to live of the response in seconds.
+        """
+        path_segments = urlsplit(url).path.split("/")
+
+        for segment, ttl in cls.CACHE_TTLS:
+            if segment in path_segments:
+                return ttl
+
+        return cls.DEFAULT_CACHE_TTL
+
+    @classmethod
+    def enable_disk_cache(cls, directory: typing.Optional[typing.Union[str, pathlib.Path]] = None) -> None:
+        """
+        Saves responses to disk as well, so that requests sent in later runs only download responses that have changed.
+
+        Parameters:
+            directory (str, pathlib.Path, optional): The directory to save the responses to, defaults to ~/.cache/falcon_alliance.
+        """  # noqa
+        cls.disk_cache_dir = (
+            pathlib.Path(directory) if directory else pathlib.Path.home() / ".cache" / "falcon_alliance"
+        )
+        cls.disk_cache_dir.mkdir(parents=True, exist_ok=True)
 
-            if isinstance(response_json, dict) and response_json.get("Error"):
-                raise TBAError(response_json["Error"])
-            else:
-                return response_json
+    @classmethod
+    def _disk_cache_path(cls, cache_key: typing.Tuple[str, str]) -> pathlib.Path:
+        """Retrieves the path of the file the response from the given URL and API key is saved to in the disk cache."""
+        url, api_key = cache_key
+        return (
+            cls.disk_cache_dir
+            / f"{hashlib.blake2b(f'{api_key} {url}'.encode('utf8'), digest_size=16).hexdigest()}.json"
+        )
+
+    @classmethod
+    def _read_disk_cache(cls, cache_key: typing.Tuple[str, str]) -> typing.Optional[typing.Tuple[float, str, bytes]]:
+        """
+        Reads the response from the given URL and API key saved in the disk cache.
+
+        Parameters:
+            cache_key (tuple): The URL the response came from and the API key it was requested with.
+
+        Returns:
+            An entry in the same format as the in-memory cache that has already expired, so it is always revalidated, or None if there's no saved response.
+        """  # noqa
+        try:
+            cached_response = json_loads(cls._disk_cache_path(cache_key).read_bytes())
+            return 0.0, cached_response["etag"], cached_response["body"].encode("utf8")
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @classmethod
+    def _write_disk_cache(cls, cache_key: typing.Tuple[str, str], etag: str, response_body: bytes) -> None:
+        """
+        Saves a response and its ETag to the disk cache.
+
+        Parameters:
+            cache_key (tuple): The URL the response came from and the API key it was requested with.
+            etag (str): The ETag TBA sent with the response.
+            response_body (bytes): The undecoded body of the response.
+        """
+        try:
+            cls._disk_cache_path(cache_key).write_text(json_dumps({"etag": etag, "body": response_body.decode("utf8")}))
+        except OSError:  # pragma: no cover
+            pass
+
+    @classmethod
+    def clear_cache(cls, url_segment: typing.Optional[str] = None) -> None:
+        """
+        Clears responses cached in memory so the next request to each of their URLs is sent to the API.
+
+        Parameters:
+            url_segment (str, optional): If passed in, only the responses from URLs containing this segment are cleared (eg '/event/2022chcmp'), otherwise every response is cleared.
+        """  # noqa
+        if url_segment is None:
+            cls._response_cache.clear()
+        else:
+            for cache_key in [cache_key for cache_key in cls._response_cache if url_segment in cache_key[0]]:
+                del cls._response_cache[cache_key]
 
     @classmethod
     async def post(cls, current_instance: typing.Any, data: typing.Any, url: str) -> None:
@@ -76,4 +323,10 @@ class InternalData:
     async def set_session(cls) -> None:
         """Initializes a `aiohttp.ClientSession` instance to send GET/POST requests out of."""
         if cls.session is None:
-            cls.session = aiohttp.ClientSession()
+            cls.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=cls.CONNECTION_LIMIT,
+                    ttl_dns_cache=cls.DNS_CACHE_TTL,
+                    keepalive_timeout=cls.KEEPALIVE_TIMEOUT,
+                )
+            )